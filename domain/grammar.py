@@ -277,28 +277,36 @@ def validate(pattern_str: str) -> None:
 # ──────────────────────────────────────────────────────────────
 
 _RE_BAD_CHARS = re.compile(r"[^A-Za-z0-9><\[\]\-\s]+")
-_RE_GROUPS = re.compile(r"([<\[])(.*?)([>\]])", re.S)
-_RE_OK_TOKEN = re.compile(r"[A-Za-z]+[0-9]+$")
-_RE_NAME_ONLY = re.compile(r"[A-Za-z]+$")
+# The same filter as a deletion table for ASCII text, which str.translate
+# applies per character in C; derived from the regex so the two agree.
+_BAD_ASCII_TABLE = {i: None for i in range(128) if _RE_BAD_CHARS.match(chr(i))}
+# Groups whose body is already a clean token list are left to the regex
+# engine; only the others reach the Python-level _fix_group callback.
+_RE_GROUPS = re.compile(
+    r"([<\[])(?![A-Za-z]+[0-9]+(?:-[A-Za-z]+[0-9]+)*[>\]])(.*?)([>\]])", re.S
+)
+_RE_BRACKET_GRP = re.compile(r"(?:<[^>]+>|\[[^\]]+\])")
+
+def _fix_group(m: re.Match) -> str:
+    """Keep a group's valid tokens, numbering bare names as variant 00."""
+    open_bracket, body, close_bracket = m.groups()
+    fixed = []
+    for tok in body.split("-"):
+        tok = tok.strip()
+        name = tok.rstrip("0123456789")
+        if name.isascii() and name.isalpha():
+            fixed.append(tok if len(name) < len(tok) else f"{name}00")
+    return f"{open_bracket}{'-'.join(fixed)}{close_bracket}" if fixed else ""
 
 def fix_facade_expression(expr: str) -> str:
-    expr = _RE_BAD_CHARS.sub("", expr)
-
-    def _fix_group(m: re.Match) -> str:
-        open_bracket, body, close_bracket = m.groups()
-        tokens = [tok.strip() for tok in body.split("-") if tok.strip()]
-        fixed = []
-        for tok in tokens:
-            if _RE_OK_TOKEN.fullmatch(tok):
-                fixed.append(tok)
-            elif _RE_NAME_ONLY.fullmatch(tok):
-                fixed.append(f"{tok}00")
-        return f"{open_bracket}{'-'.join(fixed)}{close_bracket}" if fixed else ""
-
+    if expr.isascii():
+        expr = expr.translate(_BAD_ASCII_TABLE)
+    else:
+        expr = _RE_BAD_CHARS.sub("", expr)
     expr = _RE_GROUPS.sub(_fix_group, expr)
     cleaned_lines = []
     for line in expr.splitlines():
-        groups = re.findall(r"(?:<[^>]+>|\[[^\]]+\])", line)
+        groups = _RE_BRACKET_GRP.findall(line)
         if groups:
             cleaned_lines.append(" ".join(groups))
     return "\n".join(cleaned_lines)
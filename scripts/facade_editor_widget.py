@@ -4,7 +4,7 @@ from PySide6.QtWidgets import (
     QTextEdit, QLabel, QSlider, QFormLayout
 )
 from PySide6.QtGui import QPixmap, QImage
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 # Import our building system components
 from domain.pattern_resolver import PatternResolver
@@ -50,8 +50,17 @@ class FacadeEditorWidget(QWidget):
             return
 
         self._last_pixmap: QPixmap | None = None  # NEW
+        # Recent blueprints by (grammar, width): sliding back to a width that
+        # was already shown skips re-parsing and re-resolving the grammar.
+        self._blueprints: dict[tuple[str, int], dict] = {}
+        # Typing and slider drags fire a change per keystroke/tick; render once
+        # the input has been still for a moment instead of on every one.
+        self._regen_timer = QTimer(self)
+        self._regen_timer.setSingleShot(True)
+        self._regen_timer.setInterval(150)
+        self._regen_timer.timeout.connect(self._do_regenerate)
         self.setup_ui()
-        self.regenerate_facade()
+        self._do_regenerate()
 
     def setup_ui(self):
         """Creates and lays out all the widgets for this widget."""
@@ -108,6 +117,10 @@ class FacadeEditorWidget(QWidget):
         self.width_label.setText(str(value))
 
     def regenerate_facade(self):
+        """Schedules a re-render, restarting the wait if one is pending."""
+        self._regen_timer.start()
+
+    def _do_regenerate(self):
         try:
             width = self.width_slider.value()
             grammar = self.grammar_input.toPlainText()
@@ -117,9 +130,7 @@ class FacadeEditorWidget(QWidget):
                 self._last_pixmap = None
                 return
 
-            num_floors = len([ln for ln in grammar.strip().splitlines() if ln.strip()]) or 1
-            floor_widths = {i: width for i in range(num_floors)}
-            facade_blueprint = self.resolver.resolve(grammar, floor_widths)
+            facade_blueprint = self._resolve(grammar, width)
             facade_image = self.generator.assemble_full_facade(facade_blueprint)
             self._last_pixmap = pil_to_qpixmap(facade_image)
             self._apply_pixmap()
@@ -129,6 +140,17 @@ class FacadeEditorWidget(QWidget):
             self._last_pixmap = None
             print(f"ERROR during regeneration: {e}")
 
+    def _resolve(self, grammar: str, width: int) -> dict:
+        """Resolves `grammar` with every floor at `width`, reusing recent results."""
+        key = (grammar, width)
+        if (blueprint := self._blueprints.get(key)) is None:
+            num_floors = sum(1 for ln in grammar.splitlines() if ln.strip()) or 1
+            blueprint = self.resolver.resolve(grammar, {i: width for i in range(num_floors)})
+            if len(self._blueprints) >= 32:
+                del self._blueprints[next(iter(self._blueprints))]  # Oldest first
+            self._blueprints[key] = blueprint
+        return blueprint
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self._apply_pixmap()
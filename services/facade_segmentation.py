@@ -2,25 +2,34 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import os
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from PySide6 import QtCore, QtGui
 from PySide6.QtCore import QBuffer, QByteArray, QIODevice, Qt, Signal
 
+from domain.grammar import fix_facade_expression
+
 # If you later move this to a config module, import from there.
 BASE_URL = "https://api.dev.atlas.design"
 # BASE_URL = "https://api.sandbox.atlas.design"
 
+# One pooled session for all pipeline steps, so the calls after the first
+# reuse its keep-alive connection instead of a fresh TCP + TLS handshake.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 # ──────────────────────────────────────────────────────────────
 # API calls (signatures unchanged)
 # ──────────────────────────────────────────────────────────────
 def call_symbolic_image(image_bytes: bytes, filename: str) -> bytes:
     url = f"{BASE_URL}/symbolic-image"
     files = {"image": (filename, image_bytes, "image/jpeg")}
-    r = requests.post(url, files=files, timeout=60)
+    r = _SESSION.post(url, files=files, timeout=60)
     r.raise_for_status()
     if "image/png" not in r.headers.get("Content-Type", ""):
         raise RuntimeError("Unexpected content-type from server")
@@ -30,7 +39,7 @@ def call_rigid_expression(symbolic_bytes: bytes, cfg: dict[str, Any]):
     url = f"{BASE_URL}/rigid-expression"
     files = {"symbolic_image": ("symbolic.png", symbolic_bytes, "image/png")}
     data = {"cfg": json.dumps(cfg)}
-    r = requests.post(url, files=files, data=data, timeout=120)
+    r = _SESSION.post(url, files=files, data=data, timeout=120)
     r.raise_for_status()
     result = r.json()
     decoded_images = {
@@ -42,37 +51,123 @@ def call_rigid_expression(symbolic_bytes: bytes, cfg: dict[str, Any]):
 def call_repeatable_expression(rigid_text: str, model: str) -> str:
     url = f"{BASE_URL}/repeatable-expression"
     payload = {"rigid_text": rigid_text, "openai_model": model}
-    r = requests.post(url, json=payload, timeout=120)
+    r = _SESSION.post(url, json=payload, timeout=120)
     r.raise_for_status()
     return r.json()["repeatable_expression"]
 
 # ──────────────────────────────────────────────────────────────
 # Utilities (unchanged; Qt-based resize)
 # ──────────────────────────────────────────────────────────────
-def resize_image_bytes(image_data: bytes, max_size: int = 1024) -> bytes:
-    pixmap = QtGui.QPixmap()
-    pixmap.loadFromData(image_data)
-
-    if pixmap.width() <= max_size and pixmap.height() <= max_size:
+# Recent scaled images keyed by (input digest, max_size, photo); `photo` picks
+# JPEG over PNG, so it must stay in the key. Re-running a step on the same
+# image (e.g. Step 2 with tweaked parameters) then skips the decode, smooth
+# scale and encode. Only the pipeline's single worker touches it.
+_RESIZE_CACHE: dict[tuple[bytes, int, bool], bytes] = {}
+_RESIZE_CACHE_SIZE = 4
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def resize_image_bytes(image_data: bytes, max_size: int = 1024, photo: bool = False) -> bytes:
+    # Runs on worker threads, so decode into a QImage rather than a QPixmap,
+    # and read the size from the header first: images that already fit are
+    # passed through without ever being decoded.
+    # Scaled images are re-encoded as lossless PNG, which symbolic images
+    # need. Opaque `photo`s become JPEG instead, a fraction of the upload.
+    if image_data[:8] == _PNG_SIGNATURE and image_data[12:16] == b"IHDR":
+        # PNG keeps its size at a fixed offset; skip copying into a QBuffer.
+        width = int.from_bytes(image_data[16:20], "big")
+        height = int.from_bytes(image_data[20:24], "big")
+        if width <= max_size and height <= max_size:
+            return image_data
+
+    source = QBuffer()
+    source.setData(image_data)
+    reader = QtGui.QImageReader(source)
+    size = reader.size()
+    if size.isValid() and size.width() <= max_size and size.height() <= max_size:
         return image_data
 
-    scaled_pixmap = pixmap.scaled(
-        max_size, max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-    )
+    key = (hashlib.blake2b(image_data, digest_size=16).digest(), max_size, photo)
+    if (cached := _RESIZE_CACHE.get(key)) is not None:
+        return cached
+
+    if size.isValid():
+        # Let the reader decode straight to the target size: JPEG scales while
+        # decoding, other formats are smooth-scaled by the reader itself.
+        reader.setScaledSize(size.scaled(max_size, max_size, Qt.KeepAspectRatio))
+        scaled_image = reader.read()
+    else:
+        image = reader.read()
+        if image.width() <= max_size and image.height() <= max_size:
+            return image_data
+        scaled_image = image.scaled(
+            max_size, max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
 
     byte_array = QByteArray()
     buffer = QBuffer(byte_array)
     buffer.open(QIODevice.WriteOnly)
-    scaled_pixmap.save(buffer, "PNG")
-    return byte_array.data()
+    if photo and not scaled_image.hasAlphaChannel():
+        scaled_image.save(buffer, "JPEG", 90)
+    else:
+        scaled_image.save(buffer, "PNG")
+    result = byte_array.data()
+    if len(_RESIZE_CACHE) >= _RESIZE_CACHE_SIZE:
+        del _RESIZE_CACHE[next(iter(_RESIZE_CACHE))]  # Oldest first
+    _RESIZE_CACHE[key] = result
+    return result
 
 # ──────────────────────────────────────────────────────────────
 # Worker threads (original names + signatures restored)
 # ──────────────────────────────────────────────────────────────
-class SymbolicThread(QtCore.QThread):
+# The steps run one at a time, so a single pooled thread serves them all and
+# stays alive between steps (expiryTimeout) instead of one QThread per call.
+# It is separate from the global pool so a step never waits behind icon jobs.
+_API_POOL = QtCore.QThreadPool()
+_API_POOL.setMaxThreadCount(1)
+_drain_hooked = False
+
+def _drain_api_pool() -> None:
+    """Drops queued steps and waits for the running one before the app exits.
+
+    The workers are parented to the panel, which is torn down after exec()
+    returns; a step still inside `run()` would then emit on a deleted object.
+    """
+    _API_POOL.clear()
+    _API_POOL.waitForDone()
+
+class _ApiWorker(QtCore.QObject):
+    """
+    Runs `run()` on the API pool, keeping QThread's start()/finished interface.
+
+    Signals emitted from `run()` are delivered queued in the receiver's thread.
+    """
+    error = Signal(str)
+    finished = Signal()
+
+    def start(self) -> None:
+        global _drain_hooked
+        app = QtCore.QCoreApplication.instance()
+        if app is not None and not _drain_hooked:
+            app.aboutToQuit.connect(_drain_api_pool)
+            _drain_hooked = True
+        _API_POOL.start(self._run_and_finish)
+
+    def _run_and_finish(self) -> None:
+        try:
+            self.run()
+        finally:
+            self.finished.emit()
+
+    def run(self) -> None:
+        """
+        Does the step's work on the pool thread. Subclasses override it and
+        report through their own result signal or `error`; the base does nothing.
+        """
+
+class SymbolicThread(_ApiWorker):
     """Calls the symbolic-image API without blocking the UI."""
     result_ready = Signal(bytes)
-    error = Signal(str)
 
     def __init__(self, image_path: str, parent=None):
         super().__init__(parent)
@@ -82,16 +177,15 @@ class SymbolicThread(QtCore.QThread):
         try:
             with open(self.image_path, "rb") as f:
                 original_bytes = f.read()
-            resized_input_bytes = resize_image_bytes(original_bytes, max_size=2048)
+            resized_input_bytes = resize_image_bytes(original_bytes, max_size=2048, photo=True)
             result = call_symbolic_image(resized_input_bytes, os.path.basename(self.image_path))
             self.result_ready.emit(result)
         except Exception as exc:
             self.error.emit(str(exc))
 
-class RigidThread(QtCore.QThread):
+class RigidThread(_ApiWorker):
     """Calls the rigid-expression API."""
     result_ready = Signal(str, dict)
-    error = Signal(str)
 
     def __init__(self, symbolic_bytes: bytes, cfg: dict[str, Any], parent=None):
         super().__init__(parent)
@@ -102,14 +196,15 @@ class RigidThread(QtCore.QThread):
         try:
             resized_bytes = resize_image_bytes(self.symbolic_bytes, max_size=1024)
             text, visuals = call_rigid_expression(resized_bytes, self.cfg)
+            # Emit decoded QImages, keeping the PNG decode off the UI thread.
+            visuals = {key: QtGui.QImage.fromData(data) for key, data in visuals.items()}
             self.result_ready.emit(text, visuals)
         except Exception as exc:
             self.error.emit(str(exc))
 
-class RepeatableThread(QtCore.QThread):
-    """Calls the repeatable-expression API."""
+class RepeatableThread(_ApiWorker):
+    """Calls the repeatable-expression API and emits the cleaned-up expression."""
     result_ready = Signal(str)
-    error = Signal(str)
 
     def __init__(self, rigid_text: str, model: str, parent=None):
         super().__init__(parent)
@@ -119,7 +214,7 @@ class RepeatableThread(QtCore.QThread):
     def run(self):
         try:
             result = call_repeatable_expression(self.rigid_text, self.model)
-            self.result_ready.emit(result)
+            self.result_ready.emit(fix_facade_expression(result))
         except Exception as exc:
             self.error.emit(str(exc))
 
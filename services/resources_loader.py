@@ -49,7 +49,8 @@ class IconFiles:
         cls.categories = {}
         # Iterate through each item in the user_assets folder
         for category_path in cls.folder.iterdir():
-            if category_path.is_dir():
+            # Hidden folders (e.g. the palette's scaled-icon cache) are not categories.
+            if category_path.is_dir() and not category_path.name.startswith("."):
                 category_name = category_path.name
                 icon_set: IconSet = {}
                 # Scan for .png files within this subdirectory
@@ -14,36 +14,35 @@ if TYPE_CHECKING:
     pass
 
 
+_REMOVE_MENU_QSS = """
+    QMenu {
+        background: #ffffff;
+        color: #000000;
+        border: 1px solid #a0a0a0;
+    }
+    QMenu::item:selected {
+        background: #3874f2;
+        color: #ffffff;
+    }
+"""
+
+
 def add_remove_context_menu(widget: QWidget, remove_cb: Callable[[], None]) -> None:
     """
     Attaches a standardized context menu to a widget.
 
-    This function creates and configures a QMenu with a single "Remove" action.
-    It also sets up a keyboard shortcut (Delete/Backspace) that triggers the
+    This function sets up a "Remove" action, shown in a context menu on
+    right-click, and a keyboard shortcut (Delete/Backspace) that triggers the
     same remove action when the widget has focus.
 
+    The menu itself is only built when it is requested: this runs for every
+    module placed on the canvas, and most of them are never right-clicked.
+
     Args:
         widget: The QWidget to which the context menu and action will be attached.
         remove_cb: The callback function to be executed when the "Remove"
                    action is triggered by the menu or shortcut.
     """
-    # Create the menu and associate it with the parent widget.
-    menu = QMenu(widget)
-
-    # Allow the menu to have a custom background color via stylesheets.
-    menu.setAttribute(Qt.WA_StyledBackground, True)
-    menu.setStyleSheet("""
-        QMenu {
-            background: #ffffff;
-            color: #000000;
-            border: 1px solid #a0a0a0;
-        }
-        QMenu::item:selected {
-            background: #3874f2;
-            color: #ffffff;
-        }
-    """)
-
     # Create the "Remove" action. Parenting it to the widget ensures the action's
     # lifecycle is tied to the widget's.
     act_remove = QAction("Remove", widget)
@@ -57,9 +56,6 @@ def add_remove_context_menu(widget: QWidget, remove_cb: Callable[[], None]) -> N
     # Connect the action's trigger to the provided callback function.
     act_remove.triggered.connect(remove_cb)
 
-    # This adds the action as a visible item in the context menu.
-    menu.addAction(act_remove)
-
     # This associates the action (and its shortcut) with the widget, allowing the
     # shortcut to work even when the menu is not visible.
     widget.addAction(act_remove)
@@ -68,11 +64,24 @@ def add_remove_context_menu(widget: QWidget, remove_cb: Callable[[], None]) -> N
     widget.setContextMenuPolicy(Qt.CustomContextMenu)
 
     # When the widget requests a context menu (e.g., on right-click),
-    # execute the menu at the cursor's global position.
+    # build it and execute it at the cursor's global position.
     widget.customContextMenuRequested.connect(
-        lambda pos: menu.exec(widget.mapToGlobal(pos))
+        lambda pos: _exec_remove_menu(widget, act_remove, pos)
     )
 
+
+def _exec_remove_menu(widget: QWidget, act_remove: QAction, pos) -> None:
+    """Shows a one-off context menu holding `act_remove` at `pos` in `widget`."""
+    # Parented to the window rather than the widget: removing the widget from
+    # the menu must not delete the menu while its exec() is still running.
+    menu = QMenu(widget.window())
+    # Allow the menu to have a custom background color via stylesheets.
+    menu.setAttribute(Qt.WA_StyledBackground, True)
+    menu.setStyleSheet(_REMOVE_MENU_QSS)
+    menu.addAction(act_remove)
+    menu.exec(widget.mapToGlobal(pos))
+    menu.deleteLater()
+
 def create_library_context_menu(widget: QWidget, actions: Dict[str, Callable]) -> QMenu:
     """
     Creates a standardized context menu for library-style list widgets.
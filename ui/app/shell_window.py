@@ -13,6 +13,7 @@ from PySide6.QtGui import QPixmap, Qt, QAction, QActionGroup
 # Import using your current file locations
 from ui.segmentation_editor.segmentation_panel import SegmentationPanel
 from ui.pattern_editor.pattern_editor_panel import PatternEditorPanel
+from ui.pattern_editor.module_item import PATTERN_EDITOR_STYLESHEET
 
 
 
@@ -112,7 +113,7 @@ APP_STYLESHEET = """
     QSplitter::handle:pressed {
         background: #5c85ad;
     }
-"""
+""" + PATTERN_EDITOR_STYLESHEET
 
 
 
@@ -148,14 +149,17 @@ class ShellWindow(QMainWindow):
         self.setWindowTitle("Interactive Building Grammar")
         self.resize(1600, 900)
 
-        # Workspaces
+        # Workspaces. The pattern editor (3D viewer, libraries, default floor
+        # set) is by far the most expensive to build and the shell opens on
+        # segmentation, so it is only built the first time it is shown.
         self.segmentation_ws = SegmentationWorkspace()
-        self.editor_ws = PatternEditorWorkspace()
+        self.editor_ws: PatternEditorWorkspace | None = None
 
         # Central stack
         self.stack = QStackedWidget()
         self.stack.addWidget(self.segmentation_ws)  # index 0
-        self.stack.addWidget(self.editor_ws)        # index 1
+        self.stack.addWidget(QWidget())             # index 1, until the editor is built
+        self.stack.currentChanged.connect(self._on_page_changed)
         self.setCentralWidget(self.stack)
 
         # Toolbar
@@ -206,9 +210,27 @@ class ShellWindow(QMainWindow):
         )
         act_seed.setChecked(True)
 
+    def _ensure_editor_ws(self) -> PatternEditorWorkspace:
+        """Builds the pattern editor on first use, in place of its placeholder."""
+        if self.editor_ws is None:
+            placeholder = self.stack.widget(1)
+            self.editor_ws = PatternEditorWorkspace()
+            self.stack.insertWidget(1, self.editor_ws)
+            if self.stack.currentWidget() is placeholder:
+                self.stack.setCurrentWidget(self.editor_ws)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+        return self.editor_ws
+
+    @Slot(int)
+    def _on_page_changed(self, index: int) -> None:
+        if index == 1:
+            self._ensure_editor_ws()
+
     @Slot(str, str)
     def on_pattern_generated(self, pattern_str: str, mode: str):
         """Receive pattern from segmentation and push it into editor with proper mode."""
-        self.stack.setCurrentWidget(self.editor_ws)
-        self.editor_ws.set_editor_mode(mode)
-        self.editor_ws.load_pattern(pattern_str)
+        editor_ws = self._ensure_editor_ws()
+        self.stack.setCurrentWidget(editor_ws)
+        editor_ws.set_editor_mode(mode)
+        editor_ws.load_pattern(pattern_str)
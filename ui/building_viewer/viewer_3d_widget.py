@@ -117,13 +117,6 @@ class PyVistaViewerWidget(QtInteractor):
         actor = self.add_mesh(mesh, texture=texture, name=actor_name, culling=culling)
         self._managed_actors[actor_name] = actor
 
-    def clear_scene(self):
-        for actor in self._managed_actors.values():
-            if actor in self._meta_by_actor:
-                del self._meta_by_actor[actor]
-            self.remove_actor(actor)
-        self._managed_actors.clear()
-
     def _on_mesh_pick(self, mesh: pyvista.DataSet):
         """
         This callback is triggered when a mesh is picked. It reads the
@@ -138,8 +131,6 @@ class PyVistaViewerWidget(QtInteractor):
             import json
             meta_json = mesh.field_data['meta_info'][0]
             meta = json.loads(meta_json)
-
-            print(f">>> MESH PICKED: Emitting meta {meta}")
             self.picked.emit(meta)
 
 
@@ -70,54 +70,7 @@ class FloorLibraryPanel(QWidget):
             item.setData(Qt.UserRole, entry['id'])
             self.floor_set_list.addItem(item)
 
-    # --- Action Slots (Unchanged, but provided for completeness) ---
-    def _populate_floor_set_list(self):
-        # ... (This method is correct and unchanged) ...
-        self.floor_set_list.clear()
-        default_item = QListWidgetItem("Default Floors (Built-in)")
-        default_item.setData(Qt.UserRole, "default")
-        self.floor_set_list.addItem(default_item)
-        for entry in self.asset_manager.get_floor_set_entries():
-            item = QListWidgetItem(entry['display_name'])
-            item.setData(Qt.UserRole, entry['id'])
-            self.floor_set_list.addItem(item)
-
-    @Slot()
-    def _on_load_clicked(self):
-        """
-        Gets the ID of the selected floor set and emits the load_requested signal.
-        """
-        current_item = self.floor_set_list.currentItem()
-        if not current_item and self.floor_set_list.count() > 0:
-            current_item = self.floor_set_list.item(0) # Default to first item for startup
-        if not current_item: return
-
-        # --- THIS IS THE FIX ---
-        # Get the ID (string) from the item's data and emit it.
-        floor_set_id = current_item.data(Qt.UserRole)
-        self.load_requested.emit(floor_set_id)
-        # --- END OF FIX ---
-
-    @Slot(object)
-    def _show_context_menu(self, pos):
-        item = self.floor_set_list.itemAt(pos)
-        if not item: return
-
-        is_user_item = item.data(Qt.UserRole) != "default"
-
-        actions = {"Load": self._on_load_clicked}
-        if is_user_item:
-            actions["Save"] = self.save_requested.emit
-            actions["---"] = None
-            actions["Rename"] = self._on_rename_clicked
-            actions["Delete"] = self._on_delete_clicked
-
-        actions["---"] = None
-        actions["Export..."] = self._on_export_clicked
-
-        menu = create_library_context_menu(self, actions)
-        menu.exec(self.floor_set_list.mapToGlobal(pos))
-
+    # --- Action Slots ---
     @Slot()
     def _on_load_clicked(self):
         current_item = self.floor_set_list.currentItem()
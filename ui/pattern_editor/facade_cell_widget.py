@@ -1,22 +1,26 @@
 from __future__ import annotations
-import json
 
-from PySide6.QtCore import Qt, Signal, QMimeData, QVariantAnimation, QEasingCurve
+from PySide6.QtCore import Qt, Signal, QSize, QVariantAnimation, QEasingCurve
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QWidget, QSizePolicy
-from PySide6.QtGui import QMouseEvent, QColor
+from PySide6.QtGui import QMouseEvent, QColor, QPainter, QPaintEvent
 
 from domain.grammar import REPEATABLE, RIGID
 from ui.pattern_editor.module_item import (
-    GroupWidget, ModuleWidget, _cleanup_empty_group, GroupKind
+    GroupWidget, ModuleWidget, _cleanup_empty_group, _read_module_drop, GroupKind, _DropHoverMixin,
 )
 
 
-class FacadeCellWidget(QFrame):
+class FacadeCellWidget(_DropHoverMixin, QFrame):
     """
     A container for a single facade's worth of modules that supports a
     smooth, animated highlight effect.
     """
     structureChanged = Signal()
+    _INDICATOR_SIZE = QSize(10, 50)
+    # Highlight colours, built once rather than on every trigger.
+    _BASE_COLOR = QColor("#4a4a4a")
+    _HIGHLIGHT_COLOR = QColor("#ff0026")
+    _BORDER_COLOR = QColor("#555555")
 
     def __init__(self, mode: str = REPEATABLE, parent: QWidget | None = None):
         super().__init__(parent)
@@ -27,7 +31,8 @@ class FacadeCellWidget(QFrame):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.setObjectName("FacadeCellWidget")
 
-        # The initial stylesheet. The background color will be changed by the animation.
+        # The static stylesheet. The highlight animation paints over it (see
+        # paintEvent) instead of restyling the cell on every frame.
         self.setStyleSheet("""
             QFrame#FacadeCellWidget {
                 background-color: #4a4a4a;
@@ -36,34 +41,43 @@ class FacadeCellWidget(QFrame):
             }
         """)
 
-        # Main layout
-        root_layout = QHBoxLayout(self)
-        root_layout.setContentsMargins(4, 4, 4, 4)
-        root_layout.setSpacing(5)
-
-        self.module_container_layout = QHBoxLayout()
+        # Main layout. The groups sit directly in the cell's own layout; a
+        # wrapping root layout would only add a level to every relayout.
+        self.module_container_layout = QHBoxLayout(self)
+        self.module_container_layout.setContentsMargins(4, 4, 4, 4)
+        self.module_container_layout.setSpacing(5)
         self.module_container_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        root_layout.addLayout(self.module_container_layout, 1)
 
-        # Drop indicator
-        self._indicator = QWidget()
-        self._indicator.setFixedSize(10, 50)
-        self._indicator.setStyleSheet("background:red;")
-        self._indicator.hide()
+        # Drop-indicator state; the indicator widget itself is shared.
+        self._drop_layout = self.module_container_layout
+        self._init_drop_hover()
 
         # Animation setup
+        self._highlight_color: QColor | None = None  # Set while highlighting
         self.animation = QVariantAnimation(self)
         self.animation.valueChanged.connect(self._set_background_color)
+        self.animation.finished.connect(lambda: self._set_background_color(None))
 
-    def _set_background_color(self, color: QColor):
-        """Applies a background color to the widget's stylesheet."""
-        self.setStyleSheet(f"""
-            QFrame#FacadeCellWidget {{
-                background-color: {color.name()};
-                border: 1px solid #555;
-                border-radius: 4px;
-            }}
-        """)
+    def _set_background_color(self, color: QColor | None):
+        """
+        Sets the background painted over the stylesheet's, or None for the
+        stylesheet's own. A repaint only: a per-frame setStyleSheet would
+        re-parse the sheet and re-polish every group and module in the cell.
+        """
+        self._highlight_color = color
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        super().paintEvent(event)
+        if self._highlight_color is None:
+            return
+        # Same box as the stylesheet: 1px #555 border, 4px radius.
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._BORDER_COLOR)
+        painter.setBrush(self._highlight_color)
+        painter.drawRoundedRect(self.rect().toRectF().adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+        painter.end()
 
     def trigger_highlight(self):
         """
@@ -71,57 +85,42 @@ class FacadeCellWidget(QFrame):
         """
         self.animation.stop()
 
-        start_color = QColor("#4a4a4a")
-        highlight_color = QColor("#ff0026")
-
-        self.animation.setStartValue(start_color)
-        self.animation.setKeyValueAt(0.3, highlight_color)
-        self.animation.setEndValue(start_color)
+        self.animation.setStartValue(self._BASE_COLOR)
+        self.animation.setKeyValueAt(0.3, self._HIGHLIGHT_COLOR)
+        self.animation.setEndValue(self._BASE_COLOR)
         self.animation.setDuration(2000)
         self.animation.setEasingCurve(QEasingCurve.Type.OutQuad)
         self.animation.start()
 
     # --- Drag-and-Drop and Helper Methods ---
 
-    def dragEnterEvent(self, e: QMouseEvent):
-        mime_data = e.mimeData()
-        can_drop_module = mime_data.hasFormat("application/x-ibg-module")
-        can_drop_group = self.mode == REPEATABLE and mime_data.hasFormat("application/x-ibg-group")
-        if can_drop_module or can_drop_group:
-            e.acceptProposedAction()
-        else:
-            e.ignore()
-
-    def dragMoveEvent(self, e: QMouseEvent):
-        idx = self._insert_index(e.position().toPoint().x())
-        self._remove_indicator()
-        self.module_container_layout.insertWidget(idx, self._indicator)
-        self._indicator.show()
-        e.acceptProposedAction()
-
-    def dragLeaveEvent(self, _e: QMouseEvent):
-        self._remove_indicator()
+    def _accepts_group_drops(self) -> bool:
+        return self.mode == REPEATABLE
 
     def dropEvent(self, e: QMouseEvent) -> None:
+        # Qt only delivers a drop after an accepted enter, so the kind that
+        # dragEnterEvent classified is still valid; no need to re-check formats.
+        drag_kind, self._drag_kind = self._drag_kind, None
         self._remove_indicator()
-        mime_data = e.mimeData()
         insert_pos = self._insert_index(e.position().toPoint().x())
 
-        if mime_data.hasFormat("application/x-ibg-module"):
-            data = json.loads(mime_data.data("application/x-ibg-module").data())
+        if drag_kind == "m":
+            name, from_library = _read_module_drop(e)
             group = self._find_or_create_sandbox_group() if self.mode == RIGID else GroupWidget(parent=self)
             if self.mode == REPEATABLE:
                 group.structureChanged.connect(self.structureChanged.emit)
                 self.module_container_layout.insertWidget(insert_pos, group)
-            module = ModuleWidget(data["name"], False) if data.get("from_library") else e.source()
+            module = ModuleWidget(name, False) if from_library else e.source()
+            if not from_library and (origin := module._origin_layout):
+                origin.removeWidget(module)  # Still an item of its origin group.
             group_insert_pos = group.layout().count() if self.mode == RIGID else 0
             group.layout().insertWidget(group_insert_pos, module)
-            if not data.get("from_library"):
+            if not from_library:
                 module.show()
-                _cleanup_empty_group(module._origin_layout, self)
+                _cleanup_empty_group(module._origin_layout, None)
             e.acceptProposedAction()
             self.structureChanged.emit()
-        elif self.mode == REPEATABLE and mime_data.hasFormat("application/x-ibg-group"):
+        elif drag_kind == "g":
             group_widget: GroupWidget = e.source()
             group_widget.structureChanged.connect(self.structureChanged.emit)
             self.module_container_layout.insertWidget(insert_pos, group_widget)
@@ -135,23 +134,6 @@ class FacadeCellWidget(QFrame):
             if isinstance(widget, GroupWidget):
                 return widget
         new_group = GroupWidget(kind=GroupKind.RIGID, parent=self)
-        new_group.setStyleSheet("QFrame { background: transparent; border: none; }")
         new_group.structureChanged.connect(self.structureChanged.emit)
         self.module_container_layout.addWidget(new_group)
         return new_group
-
-    def _insert_index(self, mouse_x: int) -> int:
-        for i in range(self.module_container_layout.count()):
-            widget = self.module_container_layout.itemAt(i).widget()
-            if widget and widget is not self._indicator:
-                drop_zone_end = widget.x() + (widget.width() / 2)
-                if mouse_x < drop_zone_end:
-                    return i
-        return self.module_container_layout.count()
-
-    def _remove_indicator(self):
-        if self._indicator.parent():
-            if layout := self._indicator.parent().layout():
-                layout.removeWidget(self._indicator)
-        self._indicator.setParent(None)
-        self._indicator.hide()
\ No newline at end of file
@@ -1,18 +1,30 @@
 from __future__ import annotations
-import json
 
-from PySide6.QtCore import Qt, Signal, QMimeData
-from PySide6.QtGui import QPaintEvent, QPainter, QMouseEvent, QDrag
+from PySide6.QtCore import Qt, Signal, QMimeData, QSize
+from PySide6.QtGui import QMouseEvent, QDrag
 from PySide6.QtWidgets import (
     QFrame, QHBoxLayout, QWidget, QSizePolicy, QVBoxLayout,
-    QLineEdit, QPushButton, QStyle, QStyleOption
+    QLineEdit, QPushButton
 )
 
 from domain.grammar import REPEATABLE, RIGID
 from ui.pattern_editor.module_item import (
-    GroupWidget, ModuleWidget, _cleanup_empty_group, GroupKind
+    GroupWidget, ModuleWidget, _cleanup_empty_group, _read_module_drop, GroupKind,
+    _DropHoverMixin, _layout_midpoints,
 )
 
+# One sheet per strip, covering its header too, so each floor parses QSS once.
+# The header's object names are shared with FloorHeaderWidget, which styles
+# them differently, so these rules cannot move to the app-wide stylesheet.
+_FACADE_STRIP_QSS = """
+    QFrame#FacadeStrip { background-color: #4a4a4a; border: 1px solid #5a5a5a; border-radius: 4px; }
+    QWidget#StripHeader { background-color: #383838; border-radius: 4px; }
+    QLineEdit#FloorNameEdit { font-weight: bold; color: #e0e0e0; border: 1px solid #555; padding: 4px; background-color: #484848; }
+    QPushButton#RemoveButton { font-family: "Segoe UI", Arial, sans-serif; font-weight: bold; font-size: 14px; color: #aaa; background-color: #484848; border: 1px solid #555; }
+    QPushButton#RemoveButton:hover { background-color: #d14545; color: white; border-color: #ff6a6a; }
+    QPushButton#RemoveButton:pressed { background-color: #a13535; }
+"""
+
 # ===================================================================
 # StripHeader: The UI for floor name and remove button
 # ===================================================================
@@ -30,6 +42,8 @@ class StripHeader(QWidget):
         super().__init__(parent_strip)
         self.parent_strip = parent_strip
         self.setObjectName("StripHeader")
+        # Let Qt paint the QSS background itself; plain QWidgets skip it otherwise.
+        self.setAttribute(Qt.WA_StyledBackground, True)
 
         self.name_edit = QLineEdit()
         self.name_edit.setObjectName("FloorNameEdit")
@@ -71,37 +85,25 @@ class StripHeader(QWidget):
         layout.addWidget(self.name_edit)
         layout.addStretch()
         self.setFixedWidth(150)
-        self.setStyleSheet("""
-            QWidget#StripHeader { background-color: #383838; border-radius: 4px; }
-            QLineEdit#FloorNameEdit { font-weight: bold; color: #e0e0e0; border: 1px solid #555; padding: 4px; background-color: #484848; }
-            QPushButton#RemoveButton { font-family: "Segoe UI", Arial, sans-serif; font-weight: bold; font-size: 14px; color: #aaa; background-color: #484848; border: 1px solid #555; }
-            QPushButton#RemoveButton:hover { background-color: #d14545; color: white; border-color: #ff6a6a; }
-            QPushButton#RemoveButton:pressed { background-color: #a13535; }
-        """)
+        # Styled by the owning strip's _FACADE_STRIP_QSS.
 
     def update_label(self, floor_index: int):
         """Sets the floor name text based on its index."""
         floor_text = "Ground Floor" if floor_index == 0 else f"Floor {floor_index}"
         self.name_edit.setText(floor_text)
 
-    def paintEvent(self, event: QPaintEvent) -> None:
-        """Ensures custom styling is applied correctly."""
-        opt = QStyleOption()
-        opt.initFrom(self)
-        painter = QPainter(self)
-        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, opt, painter, self)
-
 
 # ===================================================================
 # FacadeStrip: The main component, mode-aware
 # ===================================================================
-class FacadeStrip(QFrame):
+class FacadeStrip(_DropHoverMixin, QFrame):
     """
     A container for a single floor (strip) in the facade editor.
     It can operate in 'structured' mode (with groups and a header) or
     'sandbox' mode (a simple container for modules).
     """
     structureChanged = Signal()
+    _INDICATOR_SIZE = QSize(10, 60)
     remove_requested = Signal(object)
     move_up_requested = Signal(object)
     move_down_requested = Signal(object)
@@ -115,7 +117,7 @@ class FacadeStrip(QFrame):
         self.setMinimumWidth(240)
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
         self.setObjectName("FacadeStrip")
-        self.setStyleSheet("QFrame#FacadeStrip { background-color: #4a4a4a; border: 1px solid #5a5a5a; border-radius: 4px; }")
+        self.setStyleSheet(_FACADE_STRIP_QSS)
         root_layout = QHBoxLayout(self)
         root_layout.setContentsMargins(0, 0, 0, 0)
         root_layout.setSpacing(5)
@@ -132,10 +134,9 @@ class FacadeStrip(QFrame):
         self.module_container_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         root_layout.addLayout(self.module_container_layout, 1)
 
-        self._indicator = QWidget()
-        self._indicator.setFixedSize(10, 60)
-        self._indicator.setStyleSheet("background:red;")
-        self._indicator.hide()
+        # Drop-indicator state; the indicator widget itself is shared.
+        self._drop_layout = self.module_container_layout
+        self._init_drop_hover()
 
         self.header.update_label(self.floor_index)
 
@@ -157,38 +158,21 @@ class FacadeStrip(QFrame):
             if drag.exec(Qt.MoveAction) == Qt.IgnoreAction:
                 self.show()
 
-    def dragEnterEvent(self, e: QMouseEvent):
-        """Accepts drags if they contain a module, or a group in 'structured' mode."""
-        mime_data = e.mimeData()
-        can_drop_module = mime_data.hasFormat("application/x-ibg-module")
-        can_drop_group = self.mode == REPEATABLE and mime_data.hasFormat("application/x-ibg-group")
-
-        if can_drop_module or can_drop_group:
-            e.acceptProposedAction()
-        else:
-            e.ignore()
-
-    def dragMoveEvent(self, e: QMouseEvent):
-        """Shows a visual indicator at the potential drop position."""
-        idx = self._insert_index(e.position().toPoint().x())
-        self._remove_indicator()
-        self.module_container_layout.insertWidget(idx, self._indicator)
-        self._indicator.show()
-        e.acceptProposedAction()
-
-    def dragLeaveEvent(self, _e: QMouseEvent):
-        """Hides the drop indicator when the drag leaves the widget."""
-        self._remove_indicator()
+    def _accepts_group_drops(self) -> bool:
+        """Whole groups can only be dropped in 'structured' mode."""
+        return self.mode == REPEATABLE
 
     def dropEvent(self, e: QMouseEvent) -> None:
         """Handles dropping a module or a group onto the strip."""
+        # Qt only delivers a drop after an accepted enter, so the kind that
+        # dragEnterEvent classified is still valid; no need to re-check formats.
+        drag_kind, self._drag_kind = self._drag_kind, None
         self._remove_indicator()
-        mime_data = e.mimeData()
         insert_pos = self._insert_index(e.position().toPoint().x())
 
         # Case 1: A module is dropped
-        if mime_data.hasFormat("application/x-ibg-module"):
-            data = json.loads(mime_data.data("application/x-ibg-module").data())
+        if drag_kind == "m":
+            name, from_library = _read_module_drop(e)
             # In structured mode, create a new group. In sandbox, find the single group.
             group = self._find_or_create_sandbox_group() if self.mode == RIGID else GroupWidget(parent=self)
 
@@ -196,20 +180,22 @@ class FacadeStrip(QFrame):
                 group.structureChanged.connect(self.structureChanged.emit)
                 self.module_container_layout.insertWidget(insert_pos, group)
 
-            module = ModuleWidget(data["name"], False) if data.get("from_library") else e.source()
+            module = ModuleWidget(name, False) if from_library else e.source()
+            if not from_library and (origin := module._origin_layout):
+                origin.removeWidget(module)  # Still an item of its origin group.
             group_insert_pos = group.layout().count() if self.mode == RIGID else 0
             group.layout().insertWidget(group_insert_pos, module)
 
             # If the module was moved (not new), show it and clean up its original container.
-            if not data.get("from_library"):
+            if not from_library:
                 module.show()
-                _cleanup_empty_group(module._origin_layout, self)
+                _cleanup_empty_group(module._origin_layout, None)
 
             e.acceptProposedAction()
             self.structureChanged.emit()
 
         # Case 2: A group is dropped (only in 'structured' mode)
-        elif self.mode == REPEATABLE and mime_data.hasFormat("application/x-ibg-group"):
+        elif drag_kind == "g":
             group_widget: GroupWidget = e.source()
             group_widget.structureChanged.connect(self.structureChanged.emit)
             self.module_container_layout.insertWidget(insert_pos, group_widget)
@@ -230,31 +216,12 @@ class FacadeStrip(QFrame):
 
         # If no group is found, create a new one, styled for sandbox mode.
         new_group = GroupWidget(kind=GroupKind.RIGID, parent=self)
-        new_group.setStyleSheet("QFrame { background: transparent; border: none; }")
         new_group.structureChanged.connect(self.structureChanged.emit)
         self.module_container_layout.addWidget(new_group)
         return new_group
 
-    def _insert_index(self, mouse_x: int) -> int:
-        """Calculates the insert index for a new widget based on the mouse's X-position."""
+    def _snapshot_midpoints(self) -> tuple[list[float], list[int]]:
         # In structured mode, the header takes up space that must be accounted for.
+        # Its width only matters here, so it is read once per snapshot.
         header_width = self.header.width() if self.mode == REPEATABLE else 0
-
-        for i in range(self.module_container_layout.count()):
-            widget = self.module_container_layout.itemAt(i).widget()
-            # Ensure we don't check against the indicator widget itself.
-            if widget and widget is not self._indicator:
-                drop_zone_end = header_width + widget.x() + (widget.width() / 2)
-                if mouse_x < drop_zone_end:
-                    return i
-
-        # If the drop is after all existing widgets, return the count to append.
-        return self.module_container_layout.count()
-
-    def _remove_indicator(self):
-        """Removes the drop indicator widget from the layout and hides it."""
-        if self._indicator.parent():
-            if layout := self._indicator.parent().layout():
-                layout.removeWidget(self._indicator)
-        self._indicator.setParent(None)
-        self._indicator.hide()
\ No newline at end of file
+        return _layout_midpoints(self.module_container_layout, header_width)
@@ -8,7 +8,7 @@ from domain.grammar import REPEATABLE, Group
 from domain.grammar import parse_facade_string
 from ui.pattern_editor.floor_header_widget import FloorHeaderWidget
 from ui.pattern_editor.facade_cell_widget import FacadeCellWidget
-from ui.pattern_editor.module_item import GroupWidget, ModuleWidget
+from ui.pattern_editor.module_item import GroupWidget, ModuleWidget, _schedule_delete
 
 class FloorRowWidget(QWidget):
     """
@@ -92,15 +92,17 @@ class FloorRowWidget(QWidget):
         while cell.module_container_layout.count():
             item = cell.module_container_layout.takeAt(0)
             if widget := item.widget():
-                widget.deleteLater()
+                _schedule_delete(widget)
         if not facade_str: return
         groups: List[Group] = parse_facade_string(facade_str)
         for grp_data in groups:
             ui_group = GroupWidget(kind=grp_data.kind)
             ui_group.repeat = grp_data.repeat
             ui_group.structureChanged.connect(self.structureChanged.emit)
-            cell.module_container_layout.addWidget(ui_group)
+            # Fill the group while it is still parentless, then attach it in
+            # one step so the cell's layout is invalidated once per group.
             for mod_object in grp_data.modules:
                 mod_widget = ModuleWidget(mod_object.name, False)
                 mod_widget.structureChanged.connect(ui_group.structureChanged.emit)
-                ui_group.layout().addWidget(mod_widget)
\ No newline at end of file
+                ui_group.layout().addWidget(mod_widget)
+            cell.module_container_layout.addWidget(ui_group)
\ No newline at end of file
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import json
+from bisect import bisect_right
 from enum import Enum, auto
 from typing import Optional
 
-from PySide6.QtCore import Qt, QByteArray, QMimeData, Signal
-from PySide6.QtGui import QColor, QDrag, QMouseEvent, QPixmap, QShowEvent
+from PySide6.QtCore import Qt, QByteArray, QChildEvent, QMimeData, QSize, QTimer, Signal
+from PySide6.QtGui import (
+    QColor, QDrag, QDragEnterEvent, QDragLeaveEvent, QDragMoveEvent, QDropEvent, QMouseEvent,
+    QPainter, QPixmap, QResizeEvent, QShowEvent,
+)
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QLayout, QWidget, QSizePolicy
+from shiboken6 import getCppPointer, isValid
 
 from ui.actions import add_remove_context_menu
 
@@ -22,21 +26,321 @@ GROUP_COLORS: dict[GroupKind, QColor] = {
     GroupKind.FILL: QColor("#f7d9b0"),
     GroupKind.RIGID: QColor("#9ec3f7"),
 }
+_DEFAULT_GROUP_COLOR = QColor("#cccccc")  # Fallback for unknown kinds
+
+
+def _group_rule(selector: str, color: QColor) -> str:
+    """Builds the structured-mode rule for groups matching `selector`."""
+    col = color.name()
+    # The rule also covers the group's modules (the QFrame descendants), as
+    # the former per-group stylesheets did.
+    return f"""
+    {selector}, {selector} QFrame {{
+        background: {col};
+        border: 0px solid {col};
+        border-radius: 0px;
+        padding-left: 0px;
+        padding-right: 0px;
+        padding-top: 0px;
+        padding-bottom: 6px; /* The only padding, for the drag handle */
+    }}"""
+
+
+# Pattern editor styling, installed once as part of the app-wide stylesheet
+# (see APP_STYLESHEET) and keyed off dynamic properties, so Qt parses it once
+# rather than once per widget. Later rules win ties in specificity, hence the
+# order: default, per kind, sandbox, then text-only modules.
+PATTERN_EDITOR_STYLESHEET = "".join([
+    _group_rule("GroupWidget", _DEFAULT_GROUP_COLOR),
+    *(_group_rule(f'GroupWidget[kind="{kind.name.lower()}"]', col) for kind, col in GROUP_COLORS.items()),
+    """
+    /* Rigid-mode cells: the group is just a transparent container */
+    GroupWidget[sandbox="true"], GroupWidget[sandbox="true"] QFrame {
+        background: transparent;
+        border: none;
+        padding: 0px;
+    }
+
+    /* Modules without an icon in the active set */
+    ModuleWidget[textOnly="true"], GroupWidget ModuleWidget[textOnly="true"] {
+        background: #ffffff;
+        border: 1px solid #a0a0a0;
+        padding: 0px;
+        margin: 0px;
+    }
+""",
+])
+# Drag-and-drop formats. A module drag carries the module name; the library
+# and group formats carry no data, only their presence matters.
+_DRAG_FRAME_MS = 16  # Minimum interval between drop-indicator updates (~60 Hz)
+_MODULE_MIME = "application/x-ibg-module"
+_LIBRARY_MIME = "application/x-ibg-module-library"
+_GROUP_MIME = "application/x-ibg-group"
+# Payload of formats that carry no data (group drags, the library flag). Shared
+# so starting a drag does not build a new QByteArray for them.
+_FLAG_MIME = QByteArray()
 
 
 
 def owning_layout(w: QWidget) -> Optional[QLayout]:
     """Finds the layout that directly contains the given widget."""
-    parent = w.parent()
-    if isinstance(parent, QWidget):
+    # A widget's parent is always a QWidget (never a QLayout), so the typed
+    # parentWidget() accessor is enough and avoids any Python-side type checks.
+    parent = w.parentWidget()
+    if parent is None:
+        return None
+    # Facade containers hold their groups in a layout nested inside the root
+    # one; QLayout.removeWidget does not search nested layouts.
+    if isinstance(parent, GroupWidget):
         return parent.layout()
-    # Fallback for cases where the parent might be a layout itself (less common).
-    if isinstance(parent, QLayout):
-        return parent
-    return None
+    nested = getattr(parent, "module_container_layout", None)
+    return nested if nested is not None else parent.layout()
+
+
+# The one drop indicator of the app. At most one is visible during a drag, so
+# containers borrow it (reparenting it into themselves) instead of each owning
+# their own. Created lazily, and re-created if its last host was deleted.
+_shared_indicator: Optional[QWidget] = None
+# The container the indicator is currently shown in, tracked on the Python
+# side so the per-move "already shown here?" check makes no Qt calls.
+_indicator_host: Optional[QWidget] = None
+
+
+def _indicator_shown_in(host: QWidget) -> bool:
+    """Tells whether the shared drop indicator is currently shown in `host`."""
+    return _indicator_host is host
+
+
+def _hide_indicator(host: QWidget) -> None:
+    """Hides the shared drop indicator if `host` is the container showing it."""
+    global _indicator_host
+    if _indicator_host is host:
+        _indicator_host = None
+        if isValid(_shared_indicator):
+            _shared_indicator.hide()
+
+
+def _place_indicator(host: QWidget, layout: QLayout, idx: int, size: QSize) -> None:
+    """
+    Moves the shared drop indicator to the gap in front of the layout item at `idx`.
+
+    The indicator is a free child of the container rather than a layout item,
+    so repositioning it is a plain geometry update with no relayout.
+
+    Args:
+        host: The container to show the indicator in.
+        layout: The layout whose items the indicator is placed between.
+        idx: The insert index, as returned by the container's _insert_index.
+        size: The indicator size for this kind of container.
+    """
+    global _shared_indicator, _indicator_host
+    if _shared_indicator is None or not isValid(_shared_indicator):
+        _shared_indicator = QWidget()
+        _shared_indicator.setStyleSheet("background:red;")
+    indicator = _shared_indicator
+    if indicator.parentWidget() is not host:
+        # Sizing and stacking only change with the host; moves within one
+        # container are then a bare move().
+        indicator.setParent(host)
+        indicator.setFixedSize(size)
+        indicator.raise_()
+
+    count = layout.count()
+    if idx < count:
+        x = layout.itemAt(idx).geometry().left()
+    elif count:
+        x = layout.itemAt(count - 1).geometry().right() + 1
+    else:
+        x = layout.contentsRect().left()
+    x = max(0, min(x - indicator.width() // 2, host.width() - indicator.width()))
+    indicator.move(x, (host.height() - indicator.height()) // 2)
+    indicator.show()
+    _indicator_host = host
+
+
+def _layout_midpoints(layout: QLayout, offset: int = 0,
+                      skip_hidden: bool = False) -> tuple[list[float], list[int]]:
+    """
+    Snapshots the horizontal centres of a layout's widgets for bisecting.
+
+    Args:
+        layout: A left-to-right layout.
+        offset: Added to every centre, for layouts not starting at x=0.
+        skip_hidden: Leaves out hidden widgets (e.g. the one being dragged).
+
+    Returns:
+        The sorted centres and, for each one, its index in the layout.
+    """
+    midpoints: list[float] = []
+    indices: list[int] = []
+    # Bound once: these run per child, and attribute lookups on the Qt
+    # bindings are the dominant cost of this loop.
+    item_at, add_mid, add_idx = layout.itemAt, midpoints.append, indices.append
+    for i in range(layout.count()):
+        widget = item_at(i).widget()
+        if widget and not (skip_hidden and widget.isHidden()):
+            geo = widget.geometry()
+            add_mid(offset + geo.x() + geo.width() / 2)
+            add_idx(i)
+    return midpoints, indices
+
+
+def _bisect_insert_index(midpoints: tuple[list[float], list[int]],
+                         mouse_x: float, count: int) -> int:
+    """Returns the layout index in front of the first centre right of mouse_x."""
+    centres, indices = midpoints
+    k = bisect_right(centres, mouse_x)
+    return indices[k] if k < len(indices) else count
+
+
+def _read_module_drop(e: QDropEvent) -> tuple[str, bool]:
+    """
+    Returns what a module drop carries.
+
+    Drags started in this process have their ModuleWidget as the event
+    source, whose attributes are read directly. Only foreign drops fall back
+    to the payload: the module name is the raw UTF-8 body of the module
+    format, and the library flag is the mere presence of a second format.
+
+    Returns:
+        A tuple of (module name, whether it was dragged from the library).
+    """
+    source = e.source()
+    if isinstance(source, ModuleWidget):
+        return source.name, source.is_library
+    mime = e.mimeData()
+    name = mime.data(_MODULE_MIME).data().decode()
+    return name, mime.hasFormat(_LIBRARY_MIME)
+
+
+class _DropHoverMixin:
+    """
+    Drag hovering for the containers that take module (and group) drops.
+
+    Classifies a drag once when it enters, then keeps the shared drop
+    indicator at the insertion slot under the cursor until the drag leaves
+    or drops. Hosts call _init_drop_hover() in __init__, set `_drop_layout`
+    to the layout drops are inserted into and define `_INDICATOR_SIZE`; they
+    may override _accepts_group_drops and _snapshot_midpoints.
+    """
+    _INDICATOR_SIZE: QSize
+    _drop_layout: QLayout
+
+    def _init_drop_hover(self) -> None:
+        self._last_indicator_idx: int = -1
+        # Latest drag position, applied at most once per frame by _drag_timer
+        # (created on the first hover, so idle containers own no timer).
+        self._pending_drag_x: int = 0
+        self._drag_timer: Optional[QTimer] = None
+        self._drag_kind: Optional[str] = None  # "m"odule / "g"roup while a drag hovers
+        # Child centres, snapshotted once per drag for _insert_index.
+        self._midpoints: Optional[tuple[list[float], list[int]]] = None
+
+    def _accepts_group_drops(self) -> bool:
+        """Whether whole groups may be dropped here; only modules by default."""
+        return False
+
+    def _snapshot_midpoints(self) -> tuple[list[float], list[int]]:
+        """Takes the child centres _insert_index bisects; see _layout_midpoints."""
+        return _layout_midpoints(self._drop_layout)
+
+    def _insert_index(self, mouse_x: int) -> int:
+        """Calculates the insert index for a drop at the mouse's X-position."""
+        if self._midpoints is None:
+            self._midpoints = self._snapshot_midpoints()
+        # If the drop is after all existing widgets, this returns the count to append.
+        return _bisect_insert_index(self._midpoints, mouse_x, self._drop_layout.count())
+
+    def dragEnterEvent(self, e: QDragEnterEvent) -> None:
+        """Accepts module drags, and group drags where the host allows them."""
+        # Classify the drag once; moves only look at the cached answer.
+        mime_data = e.mimeData()
+        if mime_data.hasFormat(_MODULE_MIME):
+            self._drag_kind = "m"
+        elif self._accepts_group_drops() and mime_data.hasFormat(_GROUP_MIME):
+            self._drag_kind = "g"
+        else:
+            self._drag_kind = None
+
+        if self._drag_kind:
+            self._midpoints = None  # Geometry may have changed since the last drag.
+            e.acceptProposedAction()
+        else:
+            e.ignore()
+
+    def dragMoveEvent(self, e: QDragMoveEvent) -> None:
+        """Shows the drop indicator at the potential drop position."""
+        if self._drag_kind is None:
+            e.ignore()
+            return
+        # Fast mice deliver far more moves than the screen can show. A move
+        # outside a frame window is applied at once; moves inside one only
+        # record the position, which the timer applies when the window ends,
+        # so the indicator always settles where a drop would land.
+        self._pending_drag_x = e.position().toPoint().x()
+        timer = self._drag_timer
+        if timer is None:
+            timer = self._drag_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(_DRAG_FRAME_MS)
+            timer.timeout.connect(self._apply_pending_drag)
+        if not timer.isActive():
+            self._apply_pending_drag()
+            timer.start()
+        e.acceptProposedAction()
+
+    def _apply_pending_drag(self) -> None:
+        """Moves the indicator to the slot under the latest drag position."""
+        if self._drag_kind is None:
+            return  # The drag left or dropped meanwhile.
+        idx = self._insert_index(self._pending_drag_x)
+        # Only move the indicator when the insertion slot actually changes.
+        if idx != self._last_indicator_idx or not _indicator_shown_in(self):
+            _place_indicator(self, self._drop_layout, idx, self._INDICATOR_SIZE)
+            self._last_indicator_idx = idx
+
+    def dragLeaveEvent(self, _e: QDragLeaveEvent) -> None:
+        """Hides the drop indicator when the drag leaves the widget."""
+        self._drag_kind = None
+        self._remove_indicator()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Drops the cached midpoints, which no longer match the layout."""
+        super().resizeEvent(event)
+        self._midpoints = None
+
+    def _remove_indicator(self) -> None:
+        """Hides the drop indicator and forgets the drag's geometry."""
+        _hide_indicator(self)
+        if self._drag_timer is not None:
+            self._drag_timer.stop()
+        self._last_indicator_idx = -1
+        self._midpoints = None
+
 
+# Holders of widgets waiting for deletion, see _schedule_delete. They stay
+# referenced here so only their deleteLater() destroys them, not the wrapper.
+_delete_batches: list[QWidget] = []
 
-def _cleanup_empty_group(layout: QLayout, emitter: QWidget) -> None:
+
+def _schedule_delete(widget: QWidget) -> None:
+    """
+    Hides `widget` and moves it into the current delete batch.
+
+    Widgets removed before control returns to the event loop (clearing a cell,
+    syncing the palette) are reparented under one hidden holder, and only the
+    holder is handed to deleteLater(): a single deferred delete takes them all.
+    """
+    if not (_delete_batches and isValid(_delete_batches[-1])):
+        _delete_batches[:] = [h for h in _delete_batches if isValid(h)]
+        holder = QWidget()
+        holder.deleteLater()
+        _delete_batches.append(holder)
+    widget.hide()
+    widget.setParent(_delete_batches[-1])
+
+
+def _cleanup_empty_group(layout: QLayout, emitter: Optional[QWidget]) -> None:
     """
     Checks if a layout's parent GroupWidget is empty, and if so, removes it.
 
@@ -46,7 +350,8 @@ def _cleanup_empty_group(layout: QLayout, emitter: QWidget) -> None:
     Args:
         layout: The layout of the group to check.
         emitter: The widget that should emit the structureChanged signal if the
-                 group is deleted.
+                 group is deleted, or None when the caller emits it anyway
+                 (drop handlers do, once, after the whole move).
     """
     if not layout:
         return  # Safety check
@@ -54,18 +359,14 @@ def _cleanup_empty_group(layout: QLayout, emitter: QWidget) -> None:
     if not isinstance(parent_group, GroupWidget):
         return
 
-    # Check if any module widgets remain in the group.
-    has_modules = any(
-        isinstance(layout.itemAt(i).widget(), ModuleWidget)
-        for i in range(layout.count())
-    )
-
-    if not has_modules:
+    # The group counts its module children itself, so no layout walk is needed.
+    if not parent_group._module_count:
         if strip_layout := owning_layout(parent_group):
             strip_layout.removeWidget(parent_group)
-        parent_group.deleteLater()
+        _schedule_delete(parent_group)
         # Ensure the overall structure change is reported.
-        emitter.structureChanged.emit()
+        if emitter is not None:
+            emitter.structureChanged.emit()
 
 
 # =========================================================================== #
@@ -82,6 +383,7 @@ class ModuleWidget(QLabel):
     its state change requires the parent view to update.
     """
     ICONS: dict[str, QPixmap] = {}  # Populated once by ModuleLibrary
+    _drag_pixmaps: dict[str, QPixmap] = {}  # Pre-rendered drag images for text modules
     structureChanged = Signal()
 
     def __init__(self, name: str, is_library: bool = False, parent: QWidget | None = None) -> None:
@@ -99,20 +401,23 @@ class ModuleWidget(QLabel):
 
         self.setContentsMargins(0,0,0,0)
 
-        # Display an icon if available; otherwise, fall back to text.
-        if name in ModuleWidget.ICONS:
-            pix: QPixmap = ModuleWidget.ICONS[name]
+        # Display an icon if available; otherwise, fall back to text. One
+        # lookup serves both the branch and the palette flag below.
+        pix: Optional[QPixmap] = ModuleWidget.ICONS.get(name)
+        if pix is not None:
             self.setPixmap(pix)
             self.setFixedSize(pix.width() , pix.height() )  # Margin
             self.setToolTip(name)  # Accessibility
         else:
             self.setText(name)
             self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._apply_palette()  # Style for text-based modules
+        self._apply_palette(pix is None)  # Flags text-based modules for styling
 
         # State for tracking drag-and-drop origin.
         self._origin_layout: Optional[QLayout] = None
-        self._origin_index: int = -1
+
+        # The drag payload only depends on the name, so encode it once.
+        self._mime_bytes = QByteArray(name.encode())
 
         # Add context menu for removal only to instances on the canvas.
         if not self.is_library:
@@ -124,9 +429,18 @@ class ModuleWidget(QLabel):
         Re-evaluates and resets the widget's pixmap based on the currently
         loaded global ICONS cache.
         """
+        # Palette syncs and canvas redraws call this for every module, while
+        # mostly nothing changed: skip if the widget already shows the icon
+        # (same pixmap data) or is already the text fallback.
+        pix: Optional[QPixmap] = ModuleWidget.ICONS.get(self.name)
+        shown = self.pixmap()
+        if pix is not None and shown.cacheKey() == pix.cacheKey():
+            return
+        if pix is None and shown.isNull() and self.property("textOnly"):
+            return
+
         # This method only applies to icon-based widgets.
-        if self.name in ModuleWidget.ICONS:
-            pix: QPixmap = ModuleWidget.ICONS[self.name]
+        if pix is not None:
             self.setPixmap(pix)
             # Ensure size is also updated if the new icon set has different dimensions
             self.setFixedSize(pix.width(), pix.height())
@@ -134,30 +448,68 @@ class ModuleWidget(QLabel):
             # If the icon is no longer in the cache, maybe fall back to text.
             self.setPixmap(QPixmap()) # Clear the pixmap
             self.setText(self.name)
-            self._apply_palette()
+        self._apply_palette(pix is None)
+        if isinstance(group := self.parentWidget(), GroupWidget):
+            group._drag_image = None  # Its rendering now shows a different icon.
 
     def _remove_self(self) -> None:
         """Removes the widget from its layout and deletes it."""
         parent_layout = owning_layout(self)
         if parent_layout:
             parent_layout.removeWidget(self)
-            self.deleteLater()
+            # Reparents into the delete batch, so the group's module count
+            # drops before the cleanup check.
+            _schedule_delete(self)
             # After removal, check if the parent group is now empty.
             _cleanup_empty_group(parent_layout, self)
         else:
-            self.deleteLater()
+            _schedule_delete(self)
             self.structureChanged.emit()
 
-    def _apply_palette(self) -> None:
-        """Applies a default visual style for text-based modules."""
-        self.setStyleSheet("""
-            QLabel {
-                background: #ffffff;
-                border: 1px solid #a0a0a0;
-                padding: 0px;
-                margin: 0px;
-            }
-        """)
+    def _apply_palette(self, text_only: Optional[bool] = None) -> None:
+        """
+        Flags text-based modules via the `textOnly` property.
+
+        `text_only` can be passed by callers that already looked the icon up;
+        otherwise it is derived from ICONS.
+
+        The actual style lives in the app-wide PATTERN_EDITOR_STYLESHEET, so
+        Qt parses it once instead of once per module instance.
+        """
+        if text_only is None:
+            text_only = self.name not in ModuleWidget.ICONS
+        if self.property("textOnly") == text_only:
+            return
+        self.setProperty("textOnly", text_only)
+        if self.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            # Re-resolve the rules so a property change on a live widget is
+            # picked up, borders and padding included.
+            self.style().unpolish(self)
+            self.style().polish(self)
+            self.updateGeometry()
+
+    def _drag_pixmap(self) -> QPixmap:
+        """
+        Returns the image shown under the cursor while dragging.
+
+        Icon modules reuse their palette pixmap, which is exactly what they
+        display, and text-only modules share a pre-rendered box per name, so
+        no drag start pays for a full widget render (grab).
+        """
+        if pix := ModuleWidget.ICONS.get(self.name):
+            return pix
+        pix = ModuleWidget._drag_pixmaps.get(self.name)
+        if pix is None:
+            width = max(60, self.fontMetrics().horizontalAdvance(self.name) + 8)
+            pix = QPixmap(width, 30)
+            pix.fill(Qt.white)
+            painter = QPainter(pix)
+            painter.setPen(QColor("#a0a0a0"))
+            painter.drawRect(0, 0, width - 1, 29)
+            painter.drawText(pix.rect(), Qt.AlignCenter, self.name)
+            painter.end()
+            ModuleWidget._drag_pixmaps[self.name] = pix
+        return pix
 
     def mousePressEvent(self, e: QMouseEvent) -> None:
         """Initiates a drag-and-drop operation for the module."""
@@ -166,37 +518,31 @@ class ModuleWidget(QLabel):
 
         # 1. Prepare MIME data with module information.
         mime = QMimeData()
-        payload = json.dumps({
-            "type": "module",
-            "name": self.name,
-            "from_library": self.is_library,
-        }).encode()
-        mime.setData("application/x-ibg-module", QByteArray(payload))
+        mime.setData(_MODULE_MIME, self._mime_bytes)
+        if self.is_library:
+            mime.setData(_LIBRARY_MIME, _FLAG_MIME)
 
         # 2. Configure and start the drag operation.
         drag = QDrag(self)
         drag.setMimeData(mime)
-        drag.setPixmap(self.grab())
+        drag.setPixmap(self._drag_pixmap())
         drag.setHotSpot(e.pos())
 
-        # 3. If moving an existing module, hide it and store its origin.
+        # 3. If moving an existing module, hide it and store its origin. It
+        #    stays in its layout; the drop target detaches it on success.
         if not self.is_library:
             self._origin_layout = owning_layout(self)
-            if self._origin_layout:
-                self._origin_index = self._origin_layout.indexOf(self)
-                self._origin_layout.removeWidget(self)
             self.hide()
 
         # 4. Execute the drag loop.
         result = drag.exec(Qt.MoveAction)
 
-        # 5. Finalize after the drag ends.
-        if not self.is_library and self._origin_layout:
-            if result != Qt.MoveAction:  # Drag was cancelled, so restore it.
-                self._origin_layout.insertWidget(self._origin_index, self)
+        # 5. Finalize after the drag ends. An accepted drop has already moved
+        #    the module and cleaned up its original group in one step.
+        if not self.is_library:
+            if result != Qt.MoveAction:  # Drag was cancelled; still in place.
                 self.show()
-            else:  # Drag succeeded, so clean up its original group if it's now empty.
-                _cleanup_empty_group(self._origin_layout, self)
+            self._origin_layout = None
 
 
 # =========================================================================== #
@@ -204,15 +550,21 @@ class ModuleWidget(QLabel):
 # =========================================================================== #
 
 
-class GroupWidget(QFrame):
+class GroupWidget(_DropHoverMixin, QFrame):
     """
     A container for ModuleWidgets that can be either 'RIGID' or 'FILL'.
     It accepts drops of modules and can itself be dragged and dropped.
     """
+    _INDICATOR_SIZE = QSize(6, 25)
+    _drag_image: Optional[QPixmap] = None  # Cached grab(), dropped when the look changes
     structureChanged = Signal()
 
     def __init__(self, kind: GroupKind = GroupKind.FILL, parent: QWidget | None = None):
         super().__init__(parent)
+        # C++ addresses of the direct ModuleWidget children, kept by childEvent.
+        # Addresses rather than wrappers: a child being destroyed is reported
+        # as a plain QObject, but its address is unchanged.
+        self._module_ptrs: set[int] = set()
         self.kind = kind
         self.repeat: int | None = None  # Reserved for future use
         self.setAcceptDrops(True)
@@ -224,11 +576,10 @@ class GroupWidget(QFrame):
         self._lay.setContentsMargins(0, 0, 0, 0)
         self._lay.setSpacing(0)
 
-        # A visual indicator for drop locations inside the group.
-        self._indicator = QWidget()
-        self._indicator.setFixedSize(6, 25)
-        self._indicator.setStyleSheet("background:red;")
-        self._indicator.hide()
+        # Drop-indicator state. The indicator itself is shared (see
+        # _place_indicator) and floats above the modules.
+        self._drop_layout = self._lay
+        self._init_drop_hover()
 
         # State for tracking drag-and-drop origin.
         self._origin_strip: Optional[QLayout] = None
@@ -240,32 +591,30 @@ class GroupWidget(QFrame):
         self._apply_palette()
 
     def _apply_palette(self) -> None:
-        """Applies styling based on the group's kind and its parent's mode."""
+        """
+        Applies styling based on the group's kind and its parent's mode.
+
+        Sets the `kind` and `sandbox` properties that the app-wide stylesheet
+        (PATTERN_EDITOR_STYLESHEET) keys on; nothing is parsed per group.
+        """
         parent_strip = self.parent()
         # Check if the parent FacadeStrip is in 'sandbox' mode.
         is_sandbox = (
             isinstance(parent_strip, QWidget) and
             getattr(parent_strip, 'mode', None) == RIGID
         )
-
-        if is_sandbox:
-            # In sandbox mode, the group is just a transparent container.
-            self.setStyleSheet("QFrame { background: transparent; border: none; padding: 0px; }")
-        else:
-            # In structured mode, styling depends on the group kind.
-            col = GROUP_COLORS.get(self.kind, QColor("#cccccc")).name()
-
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background: {col};
-                    border: 0px solid {col};
-                    border-radius: 0px;
-                    padding-left: 0px;
-                    padding-right: 0px;
-                    padding-top: 0px;
-                    padding-bottom: 6px; /* The only padding, for the drag handle */
-                }}
-            """)
+        kind = self.kind.name.lower()
+        # Called on every show, so only re-polish on real changes.
+        if self.property("kind") == kind and self.property("sandbox") == is_sandbox:
+            return
+        self.setProperty("kind", kind)
+        self.setProperty("sandbox", is_sandbox)
+        self._drag_image = None
+        if self.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            # Re-resolve the `kind`/`sandbox` selectors, padding included.
+            self.style().unpolish(self)
+            self.style().polish(self)
+            self.updateGeometry()
 
     def mouseDoubleClickEvent(self, e: QMouseEvent) -> None:
         """Toggles the group's kind between FILL and RIGID."""
@@ -281,12 +630,14 @@ class GroupWidget(QFrame):
 
         # 1. Prepare MIME data.
         mime = QMimeData()
-        mime.setData("application/x-ibg-group", QByteArray(b'{"type": "group"}'))
+        mime.setData(_GROUP_MIME, _FLAG_MIME)
 
         # 2. Configure and start the drag.
         drag = QDrag(self)
         drag.setMimeData(mime)
-        drag.setPixmap(self.grab())
+        if self._drag_image is None:
+            self._drag_image = self.grab()
+        drag.setPixmap(self._drag_image)
         drag.setHotSpot(e.pos())
 
         # 3. Store origin and hide. Unlike modules, we don't remove from the
@@ -307,62 +658,69 @@ class GroupWidget(QFrame):
         # If the drag was cancelled, the widget was never moved, so no
         # further action is needed.
 
-    def dragEnterEvent(self, e: QMouseEvent) -> None:
-        """Accepts drops only if they contain a module."""
-        if e.mimeData().hasFormat("application/x-ibg-module"):
-            e.acceptProposedAction()
-
-    def dragMoveEvent(self, e: QMouseEvent) -> None:
-        """Shows a visual indicator at the potential drop position."""
-        if not e.mimeData().hasFormat("application/x-ibg-module"):
-            return
-        idx = self._insert_index(e.position().toPoint().x())
-        self._remove_indicator()
-        self._lay.insertWidget(idx, self._indicator)
-        self._indicator.show()
-        e.acceptProposedAction()
-
-    def dragLeaveEvent(self, _e: QMouseEvent) -> None:
-        """Hides the drop indicator when the drag leaves the widget."""
-        self._remove_indicator()
-
     def dropEvent(self, e: QMouseEvent) -> None:
         """Handles dropping a module into this group."""
+        self._drag_kind = None
         self._remove_indicator()
-        data = json.loads(e.mimeData().data("application/x-ibg-module").data())
+        name, from_library = _read_module_drop(e)
         idx = self._insert_index(e.position().toPoint().x())
         source_module: ModuleWidget = e.source()
 
-        if data.get("from_library"):
+        if from_library:
             # Create a new module instance from the library.
-            new_widget = ModuleWidget(data["name"], is_library=False)
+            new_widget = ModuleWidget(name, is_library=False)
             new_widget.structureChanged.connect(self.structureChanged.emit)
             self._lay.insertWidget(idx, new_widget)
         else:
-            # Move an existing module into this group.
+            # Move an existing module into this group. It is still an (hidden)
+            # item of its origin layout, so detach it from there first.
+            if origin := source_module._origin_layout:
+                if origin is self._lay and origin.indexOf(source_module) < idx:
+                    idx -= 1
+                origin.removeWidget(source_module)
             source_module.structureChanged.connect(self.structureChanged.emit)
             self._lay.insertWidget(idx, source_module)
             source_module.show()
             # Clean up the module's original group if it's now empty.
-            _cleanup_empty_group(source_module._origin_layout, self)
+            _cleanup_empty_group(source_module._origin_layout, None)
 
+        self._drag_image = None  # A reorder within the group fires no childEvent.
         e.acceptProposedAction()
         self.structureChanged.emit()
 
-    def _insert_index(self, mouse_x: int) -> int:
-        """Calculates the insert index for a new module based on mouse X-position."""
-        for i in range(self._lay.count()):
-            widget = self._lay.itemAt(i).widget()
-            if widget and widget is not self._indicator:
-                if mouse_x < widget.x() + widget.width() / 2:
-                    return i
-        return self._lay.count()
+    def _snapshot_midpoints(self) -> tuple[list[float], list[int]]:
+        # Skip the hidden module that is currently being dragged.
+        return _layout_midpoints(self._lay, skip_hidden=True)
 
-    def _remove_indicator(self) -> None:
-        """Removes the drop indicator widget from the layout and hides it."""
-        if self._indicator.parent():
-            self._lay.removeWidget(self._indicator)
-        self._indicator.hide()
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Drops the cached drag image (and midpoints), which no longer match the size."""
+        super().resizeEvent(event)
+        self._drag_image = None
+
+    def childEvent(self, event: QChildEvent) -> None:
+        """
+        Tracks the module count and drops the cached drag image and midpoints.
+
+        Only modules joining or leaving count as a change; the drop indicator
+        passing through, or a child being re-polished, leaves both valid.
+        """
+        super().childEvent(event)
+        child = event.child()
+        if event.removed():
+            ptr = getCppPointer(child)[0]
+            if ptr in self._module_ptrs:
+                self._module_ptrs.discard(ptr)
+                self._drag_image = self._midpoints = None
+        elif isinstance(child, ModuleWidget):  # Added, or polished after construction
+            ptr = getCppPointer(child)[0]
+            if ptr not in self._module_ptrs:
+                self._module_ptrs.add(ptr)
+                self._drag_image = self._midpoints = None
+
+    @property
+    def _module_count(self) -> int:
+        """The number of modules in the group, in O(1)."""
+        return len(self._module_ptrs)
 
     def showEvent(self, event: QShowEvent) -> None:
         """
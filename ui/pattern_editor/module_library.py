@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Iterable
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
 from PySide6.QtWidgets import (
     QGridLayout,
     QPushButton,
@@ -13,10 +15,69 @@ from PySide6.QtWidgets import (
     QComboBox
 )
 
-from ui.pattern_editor.module_item import ModuleWidget
+from ui.pattern_editor.module_item import ModuleWidget, _schedule_delete
 from services.resources_loader import IconFiles
 
 
+class _IconDecodeJob(QRunnable):
+    """
+    Loads one icon scaled to `size` on a QThreadPool worker.
+
+    Only QImage is used off the GUI thread (QPixmap is GUI-thread only); the
+    result is handed back through `signals.decoded`, which Qt delivers as a
+    queued call in the receiver's thread.
+    """
+
+    class Signals(QObject):
+        decoded = Signal(str, object, float, int, QImage)  # name, path, mtime, size, image
+
+    def __init__(self, name: str, path: Path, size: int, cached: Path, stat: os.stat_result) -> None:
+        super().__init__()
+        self.name, self.path, self.size, self.cached = name, path, size, cached
+        # The caller's stat is reused rather than repeated here. If the file
+        # changes in between, the result is cached under the older mtime and
+        # simply decoded again next time.
+        self.stat = stat
+        self.signals = _IconDecodeJob.Signals()
+
+    def run(self) -> None:
+        stat = self.stat
+        self.signals.decoded.emit(self.name, self.path, stat.st_mtime, stat.st_size,
+                                  self._load(stat.st_mtime))
+
+    def _load(self, mtime: float) -> QImage:
+        """
+        Returns the scaled icon, preferring the copy persisted under
+        `IconFiles.folder/.scaled_cache`: after a restart an unchanged icon is
+        a plain PNG load instead of a decode plus smooth rescale. The cache is
+        best effort; if it cannot be written the image is just not persisted.
+        """
+        reader = QImageReader(str(self.path))
+        source_size = reader.size()
+        if source_size.isValid() and max(source_size.width(), source_size.height()) == self.size:
+            # Already icon-sized: scaling would be a no-op, so there is nothing
+            # to resample or to persist.
+            return reader.read()
+
+        if self.cached.is_file() and self.cached.stat().st_mtime >= mtime:
+            image = QImage(str(self.cached))
+            if not image.isNull():
+                return image
+
+        # Let the reader produce the target size directly: formats that can
+        # decode at reduced resolution do so, and the rest are smooth-scaled
+        # without handing a full-size intermediate image back to Python.
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(self.size, self.size, Qt.KeepAspectRatio))
+        image = reader.read()
+        try:
+            self.cached.parent.mkdir(parents=True, exist_ok=True)
+            image.save(str(self.cached), "PNG")
+        except OSError:
+            pass
+        return image
+
+
 class ModuleLibrary(QWidget):
     """
     A scrollable and responsive icon palette for available modules.
@@ -27,11 +88,18 @@ class ModuleLibrary(QWidget):
     """
 
     categoryChanged = Signal(str)
+    iconsLoaded = Signal()  # Emitted once every icon of the category is decoded
 
     # --- Constants for layout ---
     ICON_SIZE = 48  # The logical size (width and height) for each icon in pixels.
     PADDING = 4    # The spacing between grid cells in pixels.
 
+    SCALED_CACHE_DIR = ".scaled_cache"  # Persisted scaled icons, inside IconFiles.folder
+
+    # Scaled pixmaps shared by every library, keyed by source file. Entries are
+    # reused for as long as the file's (mtime, size) is unchanged.
+    _pix_cache: dict[Path, tuple[float, int, QPixmap]] = {}
+
     def __init__(self, parent: QWidget | None = None) -> None:
         """Initializes the ModuleLibrary widget."""
         super().__init__(parent)
@@ -59,26 +127,27 @@ class ModuleLibrary(QWidget):
 
         # --- Widget Initialization ---
         self._item_widgets: list[QWidget] = []
+        self._grid_cols = 0  # Columns of the current arrangement
+        self._widgets: dict[str, ModuleWidget] = {}  # Palette chips by module name
         self._add_btn = QPushButton("＋")
         self._add_btn.setFixedSize(self.ICON_SIZE, self.ICON_SIZE)
         self._add_btn.clicked.connect(self._on_add_icon)
+        self._pixmaps: dict[str, QPixmap] = {}
+        self._pending_icons: dict[str, Path] = {}  # Still being decoded
 
         # --- Styling ---
-        # <<< FIX: Remove background color to blend with parent QGroupBox.
-        self.setStyleSheet("QWidget#ModuleLibrary { background-color: transparent; }")
-
-        # Load the initial category.
-        if initial_category := self.category_selector.currentText():
-            self.set_category(initial_category)
-
-
         # Apply a background color to distinguish the library from the canvas.
+        # Set before any chip exists: changing it later re-polishes every chip.
         self.setStyleSheet("""
             QWidget#ModuleLibrary {
                 background-color: #f4f6f8;
             }
         """)
 
+        # Load the initial category.
+        if initial_category := self.category_selector.currentText():
+            self.set_category(initial_category)
+
     def set_category(self, category_name: str) -> None:
         """
         Clears and rebuilds the icon palette to display modules from the
@@ -87,16 +156,12 @@ class ModuleLibrary(QWidget):
         # 1. Get icon data for the selected category.
         icon_set = IconFiles.get_icons_for_category(category_name)
 
-        # 2. Create and cache scaled pixmaps for this category.
-        pixmap_cache = self._make_pixmap_cache(icon_set)
-        ModuleWidget.ICONS = pixmap_cache # Update the global lookup
+        # 2. Publish the cached pixmaps for this category; the rest are
+        #    decoded in the background and swapped in as they arrive.
+        self._queue_icons(icon_set)
 
-        # 3. Re-create the list of widgets to display.
-        self._item_widgets = [self._add_btn]
-        self._item_widgets.extend([
-            ModuleWidget(name, is_library=True)
-            for name in sorted(icon_set.keys())
-        ])
+        # 3. Update the list of widgets to display.
+        self._sync_item_widgets(icon_set.keys())
 
         # 4. Trigger a re-layout and emit the change signal.
         self._relayout_items()
@@ -108,30 +173,107 @@ class ModuleLibrary(QWidget):
         whenever the library's size changes.
         """
         super().resizeEvent(event)
-        self._relayout_items()
+        # Resizes arrive continuously while a splitter is dragged, but the grid
+        # only changes when another column fits or one no longer does.
+        if self._column_count() != self._grid_cols:
+            self._relayout_items()
 
+    def _column_count(self) -> int:
+        """The number of grid columns that fit the library's current width."""
+        return max(1, (self.width() // (self.ICON_SIZE + self.PADDING * 2)))
 
     def _relayout_items(self) -> None:
         """Arranges all item widgets into a responsive grid."""
+        # Freeze painting so the grid repaints once instead of once per item.
+        self._content.setUpdatesEnabled(False)
+        # Only the layout items are dropped; the chips stay children of
+        # _content, so re-adding them does not reparent (and re-polish) each.
         for i in reversed(range(self._grid.count())):
             if widget := self._grid.itemAt(i).widget():
-                widget.setParent(None)
+                self._grid.removeWidget(widget)
 
-        cols = max(1, (self.width() // (self.ICON_SIZE + self.PADDING * 2)))
+        cols = self._grid_cols = self._column_count()
         for index, widget in enumerate(self._item_widgets):
             row, col = divmod(index, cols)
             self._grid.addWidget(widget, row, col)
+        self._grid.activate()
+        self._content.setUpdatesEnabled(True)
+
+
+    def _sync_item_widgets(self, names: Iterable[str]) -> None:
+        """
+        Brings the palette's module widgets in line with `names`.
+
+        Widgets for names that are already shown are kept (and only have their
+        icon refreshed); widgets are created or deleted just for the names that
+        were added or removed. The '+' button is always the first item.
+        """
+        new_names = set(names)
+        for name in self._widgets.keys() - new_names:
+            widget = self._widgets.pop(name)
+            self._grid.removeWidget(widget)
+            _schedule_delete(widget)
+        for widget in self._widgets.values():
+            widget.refresh_icon()
+        for name in new_names - self._widgets.keys():
+            self._widgets[name] = ModuleWidget(name, is_library=True)
 
+        self._item_widgets = [self._add_btn]
+        self._item_widgets.extend(self._widgets[name] for name in sorted(new_names))
+
+    def _queue_icons(self, icon_set: dict[str, Path]) -> None:
+        """
+        Makes `icon_set` the active set of scaled QPixmaps.
 
-    def _make_pixmap_cache(self, icon_set: dict[str, Path]) -> dict[str, QPixmap]:
-        """Creates a cache of scaled QPixmaps for a given set of icons."""
-        cache: dict[str, QPixmap] = {}
+        Icons whose file is unchanged on disk since they were last decoded come
+        straight from `_pix_cache`. The others are decoded in parallel on the
+        global QThreadPool, so a large category does not block the UI; until
+        they arrive their modules show the text fallback.
+        """
+        pixmaps: dict[str, QPixmap] = {}
+        pending: dict[str, Path] = {}
+        in_flight = set(self._pending_icons.values())
+        # Loop invariants bound once; this runs over every icon of the category.
+        pix_cache = ModuleLibrary._pix_cache
+        cache_root = IconFiles.folder / self.SCALED_CACHE_DIR
+        size = self.ICON_SIZE
+        pool = QThreadPool.globalInstance()
+        on_decoded = self._on_icon_decoded
         for name, path in icon_set.items():
-            pix = QPixmap(str(path)).scaled(
-                self.ICON_SIZE, self.ICON_SIZE,
-                Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            cache[name] = pix
-        return cache
+            stat = path.stat()
+            entry = pix_cache.get(path)
+            if entry and entry[0] == stat.st_mtime and entry[1] == stat.st_size:
+                pixmaps[name] = entry[2]
+                continue
+            pending[name] = path
+            if path not in in_flight:
+                cached = cache_root / path.parent.name / f"{path.stem}_{size}.png"
+                job = _IconDecodeJob(name, path, size, cached, stat)
+                job.signals.decoded.connect(on_decoded)
+                pool.start(job)
+        self._pixmaps, self._pending_icons = pixmaps, pending
+        ModuleWidget.ICONS = self._pixmaps  # Update the global icon lookup.
+
+    def _on_icon_decoded(self, name: str, path: Path, mtime: float, size: int,
+                         image: QImage) -> None:
+        """Caches a decoded icon and, if it is still wanted, shows it."""
+        pix = QPixmap.fromImage(image)
+        ModuleLibrary._pix_cache[path] = (mtime, size, pix)
+        if self._pending_icons.get(name) != path:
+            return  # The category changed while this icon was decoding.
+        del self._pending_icons[name]
+        self._pixmaps[name] = pix
+        if widget := self._widgets.get(name):
+            widget.refresh_icon()
+        if not self._pending_icons:
+            self.iconsLoaded.emit()
+
+    @staticmethod
+    def _prune_pixmap_cache() -> None:
+        """Drops cached pixmaps whose source files are no longer catalogued."""
+        known = {path for icons in IconFiles.all_icons().values() for path in icons.values()}
+        for path in ModuleLibrary._pix_cache.keys() - known:
+            del ModuleLibrary._pix_cache[path]
 
 
 
@@ -144,10 +286,21 @@ class ModuleLibrary(QWidget):
         trigger a palette rebuild.
         """
         # --- (The logic for adding a new icon file is handled here) ---
+        self._reload_icons()
+
+    def _reload_icons(self) -> None:
+        """Re-scans the icon folders and refreshes the selector and palette."""
         IconFiles.reload()
+        # Repopulate the selector without bouncing through set_category(""),
+        # which would tear the whole palette down before _rebuild_palette.
+        current = self.category_selector.currentText()
+        self.category_selector.blockSignals(True)
         self.category_selector.clear()
         self.category_selector.addItems(IconFiles.get_category_names())
+        self.category_selector.setCurrentText(current)
+        self.category_selector.blockSignals(False)
         self._rebuild_palette()
+        self.categoryChanged.emit(self.category_selector.currentText())
 
     def _rebuild_palette(self) -> None:
         """
@@ -157,18 +310,15 @@ class ModuleLibrary(QWidget):
         re-scans the icons, rebuilds the internal widget list, and triggers
         a re-layout of the grid.
         """
-        # 1. Re-scan resource files and update the pixmap cache.
-        self._pixmaps = self._make_pixmap_cache()
-        ModuleWidget.ICONS = self._pixmaps  # Update the global icon lookup.
-
-        # 2. Re-create the list of widgets to display.
-        # The '+' button is always the first item.
-        self._item_widgets = [self._add_btn]
-        new_module_widgets = [
-            ModuleWidget(name, is_library=True)
-            for name in sorted(self._pixmaps)
-        ]
-        self._item_widgets.extend(new_module_widgets)
+        # 1. Update the pixmap cache for the active category. Unchanged icons
+        #    are reused; only new or modified files are queued for decoding.
+        self._prune_pixmap_cache()
+        icon_set = IconFiles.get_icons_for_category(self.category_selector.currentText())
+        self._queue_icons(icon_set)
+
+        # 2. Update the list of widgets to display. Only added or removed
+        #    icons create or destroy widgets.
+        self._sync_item_widgets(icon_set.keys())
 
         # 3. Trigger a re-layout to display the updated set of icons.
         self._relayout_items()
\ No newline at end of file
@@ -17,15 +17,14 @@ class PatternArea(QWidget):
         super().__init__(parent)
         self.mode = REPEATABLE
         self._floor_rows: list[FloorRowWidget] = []
+        self._update_pending = False
 
         self._root_layout = QVBoxLayout(self)
         self._root_layout.setSpacing(8)
         self._root_layout.setAlignment(Qt.AlignTop)
 
-        self._rows_layout = QVBoxLayout()
-        self._rows_layout.setSpacing(5)
-        self._rows_layout.setAlignment(Qt.AlignTop)
-        self._root_layout.addLayout(self._rows_layout, 1)  # Main content area stretches
+        self._rows_host, self._rows_layout = self._make_rows_host()
+        self._root_layout.addWidget(self._rows_host, 1)  # Main content area stretches
 
         # A single, simple horizontal layout for all bottom buttons.
         self.bottom_bar_layout = QHBoxLayout()
@@ -41,19 +40,29 @@ class PatternArea(QWidget):
         # Add this button bar to the main vertical layout.
         self._root_layout.addLayout(self.bottom_bar_layout)
 
+        # Build the initial rows with painting frozen; one pass at the end.
+        self.setUpdatesEnabled(False)
         for _ in range(num_floors):
             self._add_row_at_top()
+        self._rows_layout.activate()
+        self.setUpdatesEnabled(True)
 
     def set_mode(self, new_mode: str):
         if new_mode == self.mode or new_mode not in (REPEATABLE, RIGID): return
         self.mode = new_mode
-        current_data_str = self.get_data_as_json()
+        current_data_str = self.get_data_as_json(indent=None)
         self.load_from_json(current_data_str)
 
-    def get_data_as_json(self, indent: int = 4) -> str:
+    def get_data(self) -> list[dict]:
+        """Returns the floors as plain dicts, ground floor first."""
         building_data = [row.get_floor_data() for row in self._floor_rows]
         building_data.reverse()
-        return json.dumps(building_data, indent=indent)
+        return building_data
+
+    def get_data_as_json(self, indent: int | None = 4) -> str:
+        # Pass indent=None for strings only other code reads: json only uses
+        # its C encoder for compact output, indenting is several times slower.
+        return json.dumps(self.get_data(), indent=indent)
 
     def load_from_json(self, json_str: str) -> None:
         try:
@@ -62,12 +71,16 @@ class PatternArea(QWidget):
         except (json.JSONDecodeError, TypeError) as e:
             print(f"Error parsing or processing JSON: {e}")
             return
+        # Freeze painting while the rows are swapped so the area repaints once.
+        self.setUpdatesEnabled(False)
         self._clear_view()
         for floor_data in reversed(building_data):
             new_row = self._create_row(len(self._floor_rows))
             new_row.set_floor_data(floor_data)
             self._rows_layout.addWidget(new_row)
             self._floor_rows.append(new_row)
+        self._rows_layout.activate()
+        self.setUpdatesEnabled(True)
         self._re_index_floors()
 
     def _create_row(self, floor_idx: int) -> FloorRowWidget:
@@ -78,12 +91,26 @@ class PatternArea(QWidget):
         row.structureChanged.connect(self._schedule_update)
         return row
 
+    @staticmethod
+    def _make_rows_host() -> tuple[QWidget, QVBoxLayout]:
+        """Creates the widget the floor rows live in, with its layout."""
+        host = QWidget()
+        layout = QVBoxLayout(host)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(5)
+        layout.setAlignment(Qt.AlignTop)
+        return host, layout
+
     def _clear_view(self):
+        # Swap in an empty host and drop the old one whole: every row goes
+        # with it in a single deferred delete, instead of being taken out of
+        # the layout and deleted one by one. The old host stays parented (just
+        # hidden) until then, so deleteLater() rather than its wrapper owns it.
         self._floor_rows.clear()
-        while self._rows_layout.count():
-            item = self._rows_layout.takeAt(0)
-            if widget := item.widget():
-                widget.setParent(None); widget.deleteLater()
+        old_host = self._rows_host
+        self._rows_host, self._rows_layout = self._make_rows_host()
+        self._root_layout.replaceWidget(old_host, self._rows_host)
+        old_host.hide(); old_host.deleteLater()
 
     @Slot()
     def _add_row_at_top(self):
@@ -91,7 +118,9 @@ class PatternArea(QWidget):
         Adds a new, pre-populated floor to the top of the canvas.
         """
         # 1. Generate a unique default name for the new floor.
-        existing_names = {row.get_floor_data()["Name"] for row in self._floor_rows}
+        # Read the names straight from the headers; get_floor_data() would
+        # serialise every facade of every row just to discard it.
+        existing_names = {row.header.name_edit.text() for row in self._floor_rows}
         i = len(self._floor_rows) + 1
         while True:
             # We'll name it based on its creation order, e.g., "New Floor 4"
@@ -166,12 +195,17 @@ class PatternArea(QWidget):
     @Slot()
     def _schedule_update(self):
         """Schedules the update to run after the event loop has settled."""
+        # A load or a drop fires many structure changes back to back; they
+        # all fold into the one pending update.
+        if self._update_pending: return
+        self._update_pending = True
         QTimer.singleShot(0, self._perform_update_and_regenerate)
 
     def _perform_update_and_regenerate(self):
         """The actual deferred update logic."""
+        self._update_pending = False
         self._update_column_widths()
-        self.patternChanged.emit(self.get_data_as_json())
+        self.patternChanged.emit(self.get_data_as_json(indent=None))
 
     def _update_column_widths(self):
         """Manually synchronize column widths across all rows."""
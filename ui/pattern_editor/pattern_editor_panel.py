@@ -1,7 +1,7 @@
 from __future__ import annotations
 import json
 
-from PySide6.QtCore import Qt, Slot, Signal
+from PySide6.QtCore import Qt, Slot, Signal, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QGroupBox, QScrollArea, QSplitter, QPushButton, QFrame, QMessageBox, QInputDialog
 )
@@ -31,6 +31,13 @@ class PatternEditorPanel(QWidget):
 
         self.active_floor_set_id: str | None = "default"
 
+        # Design changes arrive in bursts (a load, a drop, several edits);
+        # the 3D rebuild runs once the burst has settled.
+        self._design_timer = QTimer(self)
+        self._design_timer.setSingleShot(True)
+        self._design_timer.setInterval(50)
+        self._design_timer.timeout.connect(self._on_design_changed)
+
         self._create_managers_and_components()
         self._setup_layouts()
         self._connect_signals()
@@ -125,15 +132,16 @@ class PatternEditorPanel(QWidget):
         """Connects all the signal and slot connections for the application."""
         # Pattern Area signals
         self.pattern_area.patternChanged.connect(self.patternChanged)
-        self.pattern_area.patternChanged.connect(self._on_design_changed)
+        self.pattern_area.patternChanged.connect(self._schedule_design_update)
         self.pattern_area.columnWidthsChanged.connect(self.column_header.update_column_widths)
 
         # Assembly Panel signals
-        self.assembly_panel.assemblyChanged.connect(self._on_design_changed)
+        self.assembly_panel.assemblyChanged.connect(self._schedule_design_update)
         self.assembly_panel.generate_button.clicked.connect(self._on_generate_button_clicked)
 
         # Library signals
         self._library.categoryChanged.connect(self.pattern_area.redraw)
+        self._library.iconsLoaded.connect(self.pattern_area.redraw)
 
         # 3D Viewer signals
         self.building_viewer.viewer.picked.connect(self._on_view_pick)
@@ -239,13 +247,14 @@ class PatternEditorPanel(QWidget):
         if target_cell:
             target_cell.trigger_highlight()
 
-    def get_floor_definitions_json(self) -> str:
+    def get_floor_definitions_json(self, indent: int | None = 4) -> str:
         """
         Public method to retrieve the complete JSON string of all floor
         definitions from the pattern area.
-        This can be used for features like exporting to a file.
+        This can be used for features like exporting to a file; pass
+        indent=None when the string is only handed to other code.
         """
-        return self.pattern_area.get_data_as_json()
+        return self.pattern_area.get_data_as_json(indent=indent)
 
     @Slot()
     def _on_save_as_triggered(self):
@@ -254,8 +263,7 @@ class PatternEditorPanel(QWidget):
         the user clicks the "Save As..." button in the floor library.
         """
         # 1. Get the current floor data directly from the PatternArea.
-        json_str = self.pattern_area.get_data_as_json()
-        current_floors_data = json.loads(json_str)
+        current_floors_data = self.pattern_area.get_data()
 
         if not current_floors_data:
             QMessageBox.warning(self, "No Data", "There are no floors in the canvas to save.")
@@ -306,8 +314,7 @@ class PatternEditorPanel(QWidget):
         else:
             # Otherwise, we can safely overwrite the existing file.
             print(f"Overwriting floor set: {self.active_floor_set_id}")
-            json_str = self.pattern_area.get_data_as_json()
-            data = json.loads(json_str)
+            data = self.pattern_area.get_data()
 
             success = self.asset_manager.update_floor_set(self.active_floor_set_id, data)
 
@@ -322,8 +329,7 @@ class PatternEditorPanel(QWidget):
         Orchestrates the entire "Save As..." workflow.
         """
         # 1. Get the current floor data directly from the PatternArea.
-        json_str = self.pattern_area.get_data_as_json()
-        current_floors_data = json.loads(json_str)
+        current_floors_data = self.pattern_area.get_data()
 
         if not current_floors_data:
             QMessageBox.warning(self, "No Data", "There are no floors in the canvas to save.")
@@ -405,10 +411,14 @@ class PatternEditorPanel(QWidget):
         Receives a request for the current floor data, gets it from the
         pattern area, and sends it back via the provided callback.
         """
-        json_str = self.pattern_area.get_data_as_json()
-        data = json.loads(json_str)
+        data = self.pattern_area.get_data()
         callback(data)
 
+    @Slot()
+    def _schedule_design_update(self):
+        """(Re)starts the debounce timer for the live 3D update."""
+        self._design_timer.start()
+
     @Slot()
     def _on_design_changed(self):
         """
@@ -420,7 +430,7 @@ class PatternEditorPanel(QWidget):
             return
 
         try:
-            floor_defs_json = self.get_floor_definitions_json()
+            floor_defs_json = self.get_floor_definitions_json(indent=None)
             b_width = int(self.assembly_panel.width_edit.text() or 0)
             b_depth = int(self.assembly_panel.depth_edit.text() or 0)
             b_height = int(self.assembly_panel.height_edit.text() or 0)
@@ -511,7 +521,7 @@ class PatternEditorPanel(QWidget):
         logic as the live update, but without the checkbox check.
         """
         try:
-            floor_defs_json = self.get_floor_definitions_json()
+            floor_defs_json = self.get_floor_definitions_json(indent=None)
             b_width = int(self.assembly_panel.width_edit.text() or 0)
             b_depth = int(self.assembly_panel.depth_edit.text() or 0)
             b_height = int(self.assembly_panel.height_edit.text() or 0)
@@ -9,13 +9,31 @@ from PySide6.QtCore import Qt, Signal, Slot
 from services.facade_segmentation import (
     SymbolicImageWorker, RigidExpressionWorker, RepeatableExpressionWorker
 )
-from domain.grammar import sanitize_rigid_for_sandbox, fix_facade_expression
+from domain.grammar import sanitize_rigid_for_sandbox
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 _ALLOWED_IMG_EXTS = {".jpg", ".jpeg", ".png"}
 
+# Parameter-form choices ➜ the values the rigid-expression API expects.
+_CFG_MODE_MAP = {"Count": "exact count", "Percentage": "percentage", "Random": "random"}
+_CFG_FC_MAP = {"Auto Detect": "auto detect", "Exact Count": "exact count"}
+
+
+def _read_scaled_pixmap(reader: QtGui.QImageReader, size: QtCore.QSize) -> QtGui.QPixmap:
+    """
+    Reads an image fitted into `size` (keeping its aspect ratio).
+
+    The reader decodes straight to the target size, which formats like JPEG
+    do while decoding, rather than a full-resolution pixmap being decoded
+    and then smooth-scaled down on the UI thread.
+    """
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(size, Qt.KeepAspectRatio))
+    return QtGui.QPixmap.fromImage(reader.read())
+
 # ---------------------------------------------------------------------------
 # 1.  Re-usable Image Drop Widget
 # ---------------------------------------------------------------------------
@@ -59,8 +77,49 @@ class ImageDropLabel(QtWidgets.QLabel):
             self.image_loaded.emit(path)
 
     def set_image(self, path: str) -> None:
-        pixmap = QtGui.QPixmap(path)
-        self.setPixmap(pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.setPixmap(_read_scaled_pixmap(QtGui.QImageReader(path), self.size()))
+
+
+class FittedImageLabel(QtWidgets.QLabel):
+    """
+    A QLabel that keeps the full image it shows and refits it when resized.
+
+    While a resize is in progress the image is refitted with a fast scale;
+    once the size has settled for _SETTLE_MS it is redone smoothly.
+    """
+    _SETTLE_MS = 50
+
+    def __init__(self, text: str = "", parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(text, parent)
+        self._source: QtGui.QImage | None = None
+        self._settle_timer = QtCore.QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(self._SETTLE_MS)
+        self._settle_timer.timeout.connect(self._fit_source)
+
+    def set_image(self, image: QtGui.QImage) -> None:
+        self._source = image
+        self._fit_source()
+
+    def setText(self, text: str) -> None:
+        self._source = None  # Text replaces the image; stop refitting it.
+        self._settle_timer.stop()
+        super().setText(text)
+
+    def resizeEvent(self, ev: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(ev)
+        if self._source is not None:
+            self._fit_source(Qt.FastTransformation)
+            self._settle_timer.start()  # Restarts while resizes keep coming.
+
+    def _fit_source(self, mode: Qt.TransformationMode = Qt.SmoothTransformation) -> None:
+        if self._source is None:
+            return
+        # Fit the contents rect rather than the whole label, so the pixmap
+        # plus frame never asks the layout for more room than the label has.
+        self.setPixmap(QtGui.QPixmap.fromImage(self._source.scaled(
+            self.contentsRect().size(), Qt.KeepAspectRatio, mode
+        )))
 
 
 # =========================================================================== #
@@ -92,7 +151,7 @@ class SegmentationPanel(QtWidgets.QWidget):
         self._symbolic_bytes: bytes | None = None
         self._rigid_text: str | None = None
         self._final_repeatable_text: str | None = None
-        self.current_thread: QtCore.QThread | None = None
+        self.current_thread: QtCore.QObject | None = None
 
     def _build_ui(self) -> None:
         """
@@ -115,14 +174,11 @@ class SegmentationPanel(QtWidgets.QWidget):
         +-------------------------------------------------------------------------+
         """
         # --- STEP 1: DEFINE ALL WIDGETS ---
-        style = self.style()
-        # Column 1: Actions
-        self.btn_sym = QtWidgets.QPushButton("1. Generate Symbolic",
-                                             icon=style.standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay))
-        self.btn_rigid = QtWidgets.QPushButton("2. Generate Rigid",
-                                               icon=style.standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay))
-        self.btn_rep = QtWidgets.QPushButton("3. Generate Repeatable",
-                                             icon=style.standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay))
+        # Column 1: Actions (one icon shared by all three step buttons)
+        play_icon = self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay)
+        self.btn_sym = QtWidgets.QPushButton("1. Generate Symbolic", icon=play_icon)
+        self.btn_rigid = QtWidgets.QPushButton("2. Generate Rigid", icon=play_icon)
+        self.btn_rep = QtWidgets.QPushButton("3. Generate Repeatable", icon=play_icon)
 
 
         self.btn_send_rigid = QtWidgets.QPushButton("➤ Send to Rigid Editor")
@@ -239,9 +295,10 @@ class SegmentationPanel(QtWidgets.QWidget):
         """)
 
     @staticmethod
-    def _make_label(text: str) -> QtWidgets.QLabel:
+    def _make_label(text: str) -> FittedImageLabel:
         """Creates a styled, framed placeholder label."""
-        lbl = QtWidgets.QLabel(text, alignment=Qt.AlignCenter)
+        lbl = FittedImageLabel(text)
+        lbl.setAlignment(Qt.AlignCenter)
         lbl.setFrameShape(QtWidgets.QFrame.StyledPanel)
         lbl.setMinimumSize(100, 100)
         return lbl
@@ -396,12 +453,12 @@ class SegmentationPanel(QtWidgets.QWidget):
         thread = RepeatableExpressionWorker(self._rigid_text, model, self)
         self._run_thread(thread, self._repeat_done, "3/3: Generating repeatable…")
 
-    def _run_thread(self, thread: QtCore.QThread, done_slot: QtCore.Slot, status_msg: str) -> None:
+    def _run_thread(self, thread: QtCore.QObject, done_slot: QtCore.Slot, status_msg: str) -> None:
         """
         A helper to configure and start a worker thread.
 
         Args:
-            thread: The QThread instance to run.
+            thread: The pipeline worker to run.
             done_slot: The slot to connect to the thread's `result_ready` signal.
             status_msg: The message to display in the status bar while running.
         """
@@ -423,16 +480,16 @@ class SegmentationPanel(QtWidgets.QWidget):
     def _rigid_done(self, text: str, visuals: dict) -> None:
         """Handles the completion of the rigid expression generation step."""
         self._rigid_text = text
-        self._set_label_pixmap_from_data(self.out_label, visuals["visualization"])
-        self._set_label_pixmap_from_data(self.grid_viz1_label, visuals["grid_visualization_1"])
-        self._set_label_pixmap_from_data(self.grid_viz2_label, visuals["grid_visualization_2"])
+        # The worker already decoded these.
+        for key, label in self._rigid_viz_labels().items():
+            label.set_image(visuals[key])
         self.rigid_text_edit.setPlainText(text)
         self.status.setText("✔ Rigid expression done. Ready for Step 3.")
 
     @Slot(str)
     def _repeat_done(self, rep_text: str) -> None:
         """Handles the completion of the repeatable expression generation step."""
-        self._final_repeatable_text = fix_facade_expression(rep_text)
+        self._final_repeatable_text = rep_text  # Already cleaned up by the worker.
         self.repeatable_text_edit.setPlainText(self._final_repeatable_text)
         self.status.setText("✔ Pipeline complete! Click “Send to Editor” to continue.")
 
@@ -476,45 +533,45 @@ class SegmentationPanel(QtWidgets.QWidget):
             (self.grid_viz1_label, "Grid Viz 1"),
             (self.grid_viz2_label, "Grid Viz 2"),
         ):
-            lbl.clear()
-            lbl.setText(txt)
+            lbl.setText(txt)  # Also drops any pixmap the label was showing.
         self.rigid_text_edit.clear()
         self.repeatable_text_edit.clear()
         self._symbolic_bytes = None
         self._rigid_text = None
         self._final_repeatable_text = None
 
+    def _rigid_viz_labels(self) -> dict[str, FittedImageLabel]:
+        """Maps each rigid-step visualisation key to the label showing it."""
+        return {
+            "visualization": self.out_label,
+            "grid_visualization_1": self.grid_viz1_label,
+            "grid_visualization_2": self.grid_viz2_label,
+        }
+
     @staticmethod
-    def _set_label_pixmap_from_data(label: QtWidgets.QLabel, data: bytes) -> None:
-        """Loads image data from bytes and displays it in a QLabel."""
-        pixmap = QtGui.QPixmap()
-        pixmap.loadFromData(data)
-        label.setPixmap(pixmap.scaled(
-            label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
+    def _set_label_pixmap_from_data(label: FittedImageLabel, data: bytes) -> None:
+        """Loads image data from bytes and displays it in a FittedImageLabel."""
+        label.set_image(QtGui.QImage.fromData(data))
 
     def _cfg(self) -> dict[str, Any]:
         """Collects current parameter-form values into a dictionary for the API."""
-        mode_map = {"Count": "exact count", "Percentage": "percentage", "Random": "random"}
-        fc_map = {"Auto Detect": "auto detect", "Exact Count": "exact count"}
-
         return {
             "windows": {
                 "connectivity": self.spin_win_conn.value(),
-                "mode": mode_map[self.cmb_win_mode.currentText()],
+                "mode": _CFG_MODE_MAP[self.cmb_win_mode.currentText()],
                 "mode_value": self.spin_win_val.value(),
             },
             "doors": {
                 "connectivity": self.spin_door_conn.value(),
-                "mode": mode_map[self.cmb_door_mode.currentText()],
+                "mode": _CFG_MODE_MAP[self.cmb_door_mode.currentText()],
                 "mode_value": self.spin_door_val.value(),
             },
             "floors": {
-                "mode": fc_map[self.cmb_floor_mode.currentText()],
+                "mode": _CFG_FC_MAP[self.cmb_floor_mode.currentText()],
                 "mode_value": self.spin_floor_inc.value(),
             },
             "columns": {
-                "mode": fc_map[self.cmb_col_mode.currentText()],
+                "mode": _CFG_FC_MAP[self.cmb_col_mode.currentText()],
                 "mode_value": self.spin_col_inc.value(),
             },
             "auto_crop": self.chk_auto_crop.isChecked(),